@@ -8,35 +8,104 @@ Goals:
 - Replace .pdf figure includes with .png counterparts for DOCX embedding.
 
 This script is intentionally conservative: it creates a derived LaTeX file and runs pandoc on it.
+
+String rewrites are single-pass: several literal replacements on the same text go through one
+compiled alternation (or str.translate), and generated output is collected in a list and joined
+once, rather than chained str.replace / += passes.
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import glob
+import hashlib
+import mmap
 import os
 import re
 import shutil
 import subprocess
-import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-
-NEWLABEL_RE = re.compile(r"\\newlabel\{(?P<label>[^}]+)\}\{\{(?P<num>[^}]*)\}\{")
-BIBCITE_RE = re.compile(r"\\bibcite\{(?P<key>[^}]+)\}\{(?P<num>[^}]+)\}")
+# Prefer lxml for the DOCX XML passes (faster parse/serialize, lower memory); the
+# stdlib ElementTree exposes the same Element/SubElement/tostring API we rely on.
+try:
+    from lxml import etree as ET
+
+    _HAVE_LXML = True
+except ImportError:  # pragma: no cover - optional dependency
+    import xml.etree.ElementTree as ET
+
+    _HAVE_LXML = False
+
+
+NEWLABEL_RE = re.compile(rb"\\newlabel\{(?P<label>[^}]+)\}\{\{(?P<num>[^}]*)\}\{")
+BIBCITE_RE = re.compile(rb"\\bibcite\{(?P<key>[^}]+)\}\{(?P<num>[^}]+)\}")
+REF_RE = re.compile(r"\\ref\{([^}]+)\}")
+PAGEREF_RE = re.compile(r"\\pageref\{([^}]+)\}")
+CITE_RE = re.compile(r"\\cite\{([^}]+)\}")
+REFCITE_RE = re.compile(r"\\(?:page)?ref\{([^}]+)\}|\\cite\{([^}]+)\}")
+FIG_PATH_RE = re.compile(r"\{(figures/[^}]+)\}")
+INPUT_RE = re.compile(r"\\input\{([^}]+)\}")
+ARTIFACTDATE_DEF_RE = re.compile(r"\\newcommand\{\\artifactdate\}\{([^}]*)\}")
+ARTIFACTDATE_DEF_LINE_RE = re.compile(r"^\\newcommand\{\\artifactdate\}\{[^}]*\}\s*$", re.MULTILINE)
+ARTIFACTDATE_RE = re.compile(r"\\artifactdate(?![A-Za-z])")
+ARTIFACTDATE_SI_DEF_RE = re.compile(r"\\newcommand\{\\artifactdateSystemImpact\}\{([^}]*)\}")
+ARTIFACTDATE_SI_DEF_LINE_RE = re.compile(
+    r"^\\newcommand\{\\artifactdateSystemImpact\}\{[^}]*\}\s*$",
+    re.MULTILINE,
+)
+ARTIFACTDATE_SI_RE = re.compile(r"\\artifactdateSystemImpact(?![A-Za-z])")
+AUTHOR_RE = re.compile(r"\\author\{([\s\S]*?)\}")
+# PDF-only helper lines and the \IEEEtitleabstractindextext{ wrapper opener, removed in one pass.
+WORD_PREAMBLE_NOISE_RE = re.compile(
+    r"^(?:\\input\{glyphtounicode\}|\\pdfgentounicode=1)\s*$|\\IEEEtitleabstractindextext\{%?",
+    re.MULTILINE,
+)
+CAPTION_RE = re.compile(r"\\caption\{([\s\S]*?)\}")
+TAB_LABEL_RE = re.compile(r"\\label\{(tab:[^}]+)\}")
+FIG_LABEL_RE = re.compile(r"\\label\{(fig:[^}]+)\}")
+FIG_CAPTION_LABEL_RE = re.compile(r"\\caption\{([\s\S]*?)\}\s*\\label\{(fig:[^}]+)\}")
+TABLE_ENV_RE = re.compile(r"(\\begin\{table\*?\}[\s\S]*?\\end\{table\*?\})")
+FIGURE_ENV_RE = re.compile(r"(\\begin\{figure\*?\}[\s\S]*?\\end\{figure\*?\})")
+# Group 1 is the env body (after the optional [placement] and leading whitespace).
+TABLE_BODY_RE = re.compile(r"\\begin\{table\*?\}(?:\[[^\]]*\])?\s*([\s\S]*?)\\end\{table\*?\}")
+TABULAR_ENV_RE = re.compile(r"(\\begin\{tabular\}[\s\S]*?\\end\{tabular\})")
+# Column-spec tokens: l/c/r, p/m/b{..}, @{..}, >{..}, *{n}{spec} (or a bare *{n}); other chars are skipped.
+SPEC_TOKEN_RE = re.compile(
+    r"[lcr]"
+    r"|[pmb@>]\{(?:[^{}]|\{[^{}]*\})*\}"
+    r"|\*\{(?P<rep>(?:[^{}]|\{[^{}]*\})*)\}(?:\{(?P<inner>(?:[^{}]|\{[^{}]*\})*)\})?"
+)
+TABULAR_FIRST_ROW_RE = re.compile(r"\\begin\{tabular\}[\s\S]*?\n([^\n]+)")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+# \begin{minipage}[..]{\linewidth}, \begin{minipage}{\linewidth} and \end{minipage} table-header wrappers.
+MINIPAGE_WRAPPER_RE = re.compile(r"\\begin\{minipage\}(?:\[[^\]]*\])?\{\\linewidth\}\s*|\\end\{minipage\}\s*")
+THEBIBLIOGRAPHY_RE = re.compile(r"\\begin\{thebibliography\}\{[^}]*\}([\s\S]*?)\\end\{thebibliography\}")
+BIBITEM_SPLIT_RE = re.compile(r"\\bibitem\{([^}]+)\}")
+TEXTTT_RE = re.compile(r"\\texttt\{([^}]*)\}")
+# \texttt/\emph/\mbox/\url{...} -> contents, \allowbreak -> "" (group 2 is None for \allowbreak).
+TEXT_CMD_STRIP_RE = re.compile(r"\\(texttt|emph|mbox|url)\{([^}]*)\}|\\allowbreak")
+BRACE_DELETE = str.maketrans("", "", "{}")
+TT_SEP_SPACING_RE = re.compile(r"\s*([/_.])\s*")
 
 
 def parse_aux(aux_path: Path) -> tuple[dict[str, str], dict[str, str]]:
     ref_map: dict[str, str] = {}
     cite_map: dict[str, str] = {}
-    text = aux_path.read_text(encoding="utf-8", errors="ignore")
-
-    for m in NEWLABEL_RE.finditer(text):
-        ref_map[m.group("label")] = m.group("num")
+    # Scan the mapped bytes directly and decode only the captured groups (no full-file str copy).
+    with aux_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ref_map, cite_map
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for m in NEWLABEL_RE.finditer(data):
+                ref_map[m.group("label").decode("utf-8", "ignore")] = m.group("num").decode("utf-8", "ignore")
 
-    for m in BIBCITE_RE.finditer(text):
-        cite_map[m.group("key")] = m.group("num")
+            for m in BIBCITE_RE.finditer(data):
+                cite_map[m.group("key").decode("utf-8", "ignore")] = m.group("num").decode("utf-8", "ignore")
 
     return ref_map, cite_map
 
@@ -53,9 +122,9 @@ def replace_refs(tex: str, ref_map: dict[str, str]) -> str:
         return ref_map.get(key, "??")
 
     # \ref{...}
-    tex = re.sub(r"\\ref\{([^}]+)\}", repl, tex)
+    tex = REF_RE.sub(repl, tex)
     # \pageref{...} (rare)
-    tex = re.sub(r"\\pageref\{([^}]+)\}", repl, tex)
+    tex = PAGEREF_RE.sub(repl, tex)
     return tex
 
 
@@ -66,10 +135,23 @@ def replace_cites(tex: str, cite_map: dict[str, str]) -> str:
         return "[" + ", ".join(nums) + "]"
 
     # Handle \cite{a,b,c}
-    tex = re.sub(r"\\cite\{([^}]+)\}", repl, tex)
+    tex = CITE_RE.sub(repl, tex)
     return tex
 
 
+def resolve_refs_cites(tex: str, ref_map: dict[str, str], cite_map: dict[str, str]) -> str:
+    """
+    replace_refs + replace_cites in a single scan (one alternation, dispatch on the matched group).
+    """
+    def repl(m: re.Match) -> str:
+        if m.lastindex == 1:
+            return ref_map.get(m.group(1), "??")
+        keys = [k.strip() for k in m.group(2).split(",") if k.strip()]
+        return "[" + ", ".join(cite_map.get(k, "??") for k in keys) + "]"
+
+    return REFCITE_RE.sub(repl, tex)
+
+
 def strip_latex_softbreaks(tex: str) -> str:
     # Remove PDF-specific soft break helpers that look ugly in Word.
     tex = tex.replace("\\allowbreak", "")
@@ -85,26 +167,21 @@ def expand_simple_macros(tex: str) -> str:
     \artifactdate would corrupt \artifactdateSystemImpact (prefix match).
     """
     # Expand \artifactdate from its \newcommand definition, if present.
-    m = re.search(r"\\newcommand\{\\artifactdate\}\{([^}]*)\}", tex)
+    m = ARTIFACTDATE_DEF_RE.search(tex)
     if m:
         date = m.group(1).strip()
         # Remove the macro definition itself to avoid producing invalid TeX like:
         # \newcommand{2026-01-16}{2026-01-16}
-        tex = re.sub(r"^\\newcommand\{\\artifactdate\}\{[^}]*\}\s*$", "", tex, flags=re.MULTILINE)
+        tex = ARTIFACTDATE_DEF_LINE_RE.sub("", tex)
         # Replace only the standalone macro token, not prefixes of other commands.
-        tex = re.sub(r"\\artifactdate(?![A-Za-z])", date, tex)
+        tex = ARTIFACTDATE_RE.sub(date, tex)
 
     # Expand \artifactdateSystemImpact too (prevents leaking macros into the DOCX).
-    m2 = re.search(r"\\newcommand\{\\artifactdateSystemImpact\}\{([^}]*)\}", tex)
+    m2 = ARTIFACTDATE_SI_DEF_RE.search(tex)
     if m2:
         dsi = m2.group(1).strip()
-        tex = re.sub(
-            r"^\\newcommand\{\\artifactdateSystemImpact\}\{[^}]*\}\s*$",
-            "",
-            tex,
-            flags=re.MULTILINE,
-        )
-        tex = re.sub(r"\\artifactdateSystemImpact(?![A-Za-z])", dsi, tex)
+        tex = ARTIFACTDATE_SI_DEF_LINE_RE.sub("", tex)
+        tex = ARTIFACTDATE_SI_RE.sub(dsi, tex)
 
     return tex
 
@@ -119,7 +196,7 @@ def replace_pdf_images_with_png(tex: str, figures_dir: Path) -> str:
                 return "{" + str(Path(path).with_suffix(".png")).replace("\\", "/") + "}"
         return "{" + path + "}"
 
-    tex = re.sub(r"\{(figures/[^}]+)\}", repl, tex)
+    tex = FIG_PATH_RE.sub(repl, tex)
     return tex
 
 
@@ -133,7 +210,7 @@ def replace_tikz_figure(tex: str, label: str, png_rel: str) -> str:
         return tex
 
     # Preserve caption text (first \caption{...})
-    cap_m = re.search(r"\\caption\{([\s\S]*?)\}\s*", block, re.DOTALL)
+    cap_m = CAPTION_RE.search(block)
     caption = cap_m.group(1).strip() if cap_m else ""
 
     # Preserve whether this was figure* (two-column) vs figure.
@@ -167,12 +244,29 @@ def rasterize_pdf_to_png(pdf: Path, out_png: Path, dpi: int) -> None:
 
     out_png.parent.mkdir(parents=True, exist_ok=True)
     base = out_png.with_suffix("")  # pdftocairo appends .png
+    # close_fds=False lets CPython launch via posix_spawn/vfork instead of fork + closing every fd;
+    # safe because Python-opened fds are non-inheritable by default (PEP 446).
     subprocess.run(
         [pdftocairo, "-png", "-r", str(dpi), "-singlefile", str(pdf), str(base)],
         check=True,
+        close_fds=False,
     )
 
 
+def backup_if_changed(path: Path, backup: Path) -> None:
+    """
+    Copy path to backup and record its blake2b digest in a "<backup>.blake2b" sidecar next to it.
+    Backup names are timestamped, so the copy is skipped when any existing backup of path in
+    that directory already carries the same digest.
+    """
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    for digest_path in backup.parent.glob(glob.escape(path.stem) + "*.blake2b"):
+        if digest_path.with_suffix("").exists() and digest_path.read_text(encoding="utf-8") == digest:
+            return
+    shutil.copy2(path, backup)
+    backup.with_name(backup.name + ".blake2b").write_text(digest, encoding="utf-8")
+
+
 def extract_figure_env_by_label(tex: str, label: str) -> str | None:
     """
     Best-effort extraction of the figure/figure* environment containing \\label{label}.
@@ -199,6 +293,16 @@ def extract_figure_env_by_label(tex: str, label: str) -> str | None:
     return tex[begin_idx : end_idx + len("\\end{figure}")]
 
 
+FIGURE_BEGIN_RE = re.compile(r"^\\begin\{figure\*?\}\[[^\]]*\]\s*", re.DOTALL)
+FIGURE_END_RE = re.compile(r"\\end\{figure\*?\}\s*$", re.DOTALL)
+CAPTION_STRIP_RE = re.compile(r"\\caption\{[\s\S]*?\}\s*")
+
+
+@functools.lru_cache(maxsize=256)
+def _label_strip_re(label: str) -> re.Pattern[str]:
+    return re.compile(rf"\\label\{{{re.escape(label)}\}}\s*")
+
+
 def build_standalone_tikz_pdf(docs: Path, tex_source: str, label: str, out_pdf: Path) -> bool:
     """
     Build a standalone PDF for a TikZ-based figure (so we can rasterize it with pdftocairo).
@@ -209,11 +313,11 @@ def build_standalone_tikz_pdf(docs: Path, tex_source: str, label: str, out_pdf:
         return False
 
     # Strip outer figure wrappers; keep content (resizebox, tikzpicture, etc.).
-    inner = re.sub(r"^\\begin\{figure\*?\}\[[^\]]*\]\s*", "", block, flags=re.DOTALL)
-    inner = re.sub(r"\\end\{figure\*?\}\s*$", "", inner, flags=re.DOTALL)
+    inner = FIGURE_BEGIN_RE.sub("", block)
+    inner = FIGURE_END_RE.sub("", inner)
     # Remove caption/label (standalone render only)
-    inner = re.sub(r"\\caption\{[\s\S]*?\}\s*", "", inner)
-    inner = re.sub(rf"\\label\{{{re.escape(label)}\}}\s*", "", inner)
+    inner = CAPTION_STRIP_RE.sub("", inner)
+    inner = _label_strip_re(label).sub("", inner)
 
     standalone = (
         "\\documentclass[preview]{standalone}\n"
@@ -283,25 +387,61 @@ def expand_inputs(tex: str, docs: Path, max_depth: int = 3) -> str:
             changed = True
             return p.read_text(encoding="utf-8", errors="ignore")
 
-        out2 = re.sub(r"\\input\{([^}]+)\}", repl, out)
+        out2 = INPUT_RE.sub(repl, out)
         out = out2
         if not changed:
             break
     return out
 
 
+# Math-mode spellings are tried before the bare macros. "$\times$" must not claim a "$" that
+# closes a following "\mu$" (the "$\mu$" form takes precedence when the two share a dollar).
+WORD_SYMBOLS = {r"\_": "_", r"$\mu$": "µ", r"$\times$": "×", r"\times": "×", r"\mu": "µ"}
+WORD_SYMBOL_RE = re.compile(r"\$\\mu\$|\$\\times\$(?!\\mu\$)|\\times|\\mu|\\_")
+
+
+def _word_symbol_repl(m: re.Match) -> str:
+    return WORD_SYMBOLS[m.group(0)]
+
+
+IEEE_WRAPPER_FIXUPS = {
+    r"\IEEEdisplaynontitleabstractindextext": "",
+    # Exact wrapper used in this paper:
+    r"\IEEEraisesectionheading{\section{Introduction}\label{sec:introduction}}": (
+        r"\section{Introduction}\label{sec:introduction}"
+    ),
+    # IEEEtran sometimes leaves an extra closing brace after IEEEkeywords in Pandoc-generated LaTeX.
+    r"\end{IEEEkeywords}}": r"\end{IEEEkeywords}",
+}
+IEEE_WRAPPER_FIXUP_RE = re.compile("|".join(map(re.escape, IEEE_WRAPPER_FIXUPS)))
+
+
+def _ieee_wrapper_fixup_repl(m: re.Match) -> str:
+    return IEEE_WRAPPER_FIXUPS[m.group(0)]
+
+
 def normalize_tex_for_word(tex: str) -> str:
     """
     Fix common TeX patterns that turn into broken paths/identifiers in Word.
     """
-    # Turn escaped underscores into literal underscores (pandoc tends to insert spaces otherwise).
-    tex = tex.replace(r"\_", "_")
-    # Replace common math symbols with Unicode to avoid unit/sign corruption.
-    tex = tex.replace(r"$\mu$", "µ")
-    tex = tex.replace(r"$\times$", "×")
-    tex = tex.replace(r"\times", "×")
-    tex = tex.replace(r"\mu", "µ")
-    return tex
+    # Turn escaped underscores into literal underscores (pandoc tends to insert spaces otherwise),
+    # and replace common math symbols with Unicode to avoid unit/sign corruption.
+    return WORD_SYMBOL_RE.sub(_word_symbol_repl, tex)
+
+
+BRACE_RE = re.compile(r"[{}]")
+
+
+def _skip_balanced_braces(tex: str, k: int, depth: int = 1) -> int:
+    """
+    Return the index just past the brace that closes an already-open group at ``k``
+    (or len(tex) if unbalanced). Only brace positions are visited, via the C regex scanner.
+    """
+    for m in BRACE_RE.finditer(tex, k):
+        depth += 1 if m.group() == "{" else -1
+        if depth == 0:
+            return m.end()
+    return len(tex)
 
 
 def unwrap_pandocbounded(tex: str) -> str:
@@ -321,17 +461,9 @@ def unwrap_pandocbounded(tex: str) -> str:
             out.append(tex[i:])
             break
         out.append(tex[i:j])
-        k = j + len(marker)
-        # parse balanced braces starting at k (inside the opening '{')
-        depth = 1
-        start = k
-        while k < n and depth > 0:
-            ch = tex[k]
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-            k += 1
+        start = j + len(marker)
+        # parse balanced braces starting inside the opening '{'
+        k = _skip_balanced_braces(tex, start)
         content = tex[start : k - 1]  # exclude the closing '}'
         out.append(content)
         i = k
@@ -352,15 +484,7 @@ def remove_braced_command(tex: str, command: str) -> str:
             out.append(tex[i:])
             break
         out.append(tex[i:j])
-        k = j + len(marker)
-        depth = 1
-        while k < n and depth > 0:
-            ch = tex[k]
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-            k += 1
+        k = _skip_balanced_braces(tex, j + len(marker))
         # skip trailing whitespace
         while k < n and tex[k].isspace():
             k += 1
@@ -374,16 +498,16 @@ def normalize_texttt_code_strings(tex: str) -> str:
     e.g., `Scripts/ run_ paper_ eval.sh` -> `Scripts/run_paper_eval.sh`.
     """
     def repl(m: re.Match) -> str:
-        s = m.group(1)
-        s = re.sub(r"/\s+", "/", s)
-        s = re.sub(r"\s+/", "/", s)
-        s = re.sub(r"_\s+", "_", s)
-        s = re.sub(r"\s+_", "_", s)
-        # Also remove spaces around dots in file names
-        s = re.sub(r"\s*\.\s*", ".", s)
+        # Drop whitespace around path/identifier separators (/ and _) and around dots in
+        # file names, all in one pass.
+        s = TT_SEP_SPACING_RE.sub(r"\1", m.group(1))
         return f"\\texttt{{{s}}}"
 
-    return re.sub(r"\\texttt\{([^}]*)\}", repl, tex)
+    return TEXTTT_RE.sub(repl, tex)
+
+
+def _text_cmd_strip_repl(m: re.Match) -> str:
+    return m.group(2) or ""
 
 
 def strip_latex_commands(text: str, cite_map: dict[str, str] | None = None) -> str:
@@ -394,13 +518,20 @@ def strip_latex_commands(text: str, cite_map: dict[str, str] | None = None) -> s
     if cite_map is not None:
         # Normalize citations before removing braces.
         s = replace_cites(s, cite_map)
-    s = re.sub(r"\\texttt\{([^}]*)\}", r"\1", s)
-    s = re.sub(r"\\emph\{([^}]*)\}", r"\1", s)
-    s = re.sub(r"\\mbox\{([^}]*)\}", r"\1", s)
-    s = re.sub(r"\\url\{([^}]*)\}", r"\1", s)
-    s = re.sub(r"\\allowbreak", "", s)
-    s = s.replace("{", "").replace("}", "")
-    s = re.sub(r"\s+", " ", s).strip()
+    return _strip_latex_markup(s)
+
+
+@functools.lru_cache(maxsize=1024)
+def _strip_latex_markup(s: str) -> str:
+    # Cite-free part of strip_latex_commands, memoized on the text alone: captions and bibliography
+    # entries recur across passes, and keying on the string avoids hashing cite_map per call.
+    # One alternation pass instead of one pass per command. Repeat until nothing matches so
+    # nested wrappers (e.g. \emph{\texttt{x}}) unwrap regardless of command order.
+    n = 1
+    while n:
+        s, n = TEXT_CMD_STRIP_RE.subn(_text_cmd_strip_repl, s)
+    s = s.translate(BRACE_DELETE)
+    s = " ".join(s.split())
     return s
 
 
@@ -417,7 +548,7 @@ def prefix_captions_for_word(tex: str, ref_map: dict[str, str], cite_map: dict[s
         return f"\\\\caption{{Fig. {n}. {cap}}}\\n\\\\label{{{lab}}}"
 
     out = tex
-    out = re.sub(r"\\caption\{([\s\S]*?)\}\s*\\label\{(fig:[^}]+)\}", fig_repl, out)
+    out = FIG_CAPTION_LABEL_RE.sub(fig_repl, out)
     return out
 
 
@@ -425,13 +556,13 @@ def rewrite_bibliography_for_word(tex: str, cite_map: dict[str, str]) -> str:
     """
     Replace thebibliography/bibitem block with a Word-friendly REFERENCES section and [n] entries.
     """
-    m = re.search(r"\\begin\{thebibliography\}\{[^}]*\}([\s\S]*?)\\end\{thebibliography\}", tex)
+    m = THEBIBLIOGRAPHY_RE.search(tex)
     if not m:
         return tex
     body = m.group(1)
 
     items: list[tuple[str, str]] = []
-    parts = re.split(r"\\bibitem\{([^}]+)\}", body)
+    parts = BIBITEM_SPLIT_RE.split(body)
     # parts: [preamble, key1, content1, key2, content2, ...]
     for i in range(1, len(parts), 2):
         key = parts[i].strip()
@@ -439,7 +570,7 @@ def rewrite_bibliography_for_word(tex: str, cite_map: dict[str, str]) -> str:
         n = cite_map.get(key, "??")
         content = strip_latex_commands(content)
         # collapse whitespace
-        content = re.sub(r"\s+", " ", content).strip()
+        content = " ".join(content.split())
         items.append((n, content))
 
     # Sort numerically when possible
@@ -472,23 +603,18 @@ def tables_to_images_for_word(
     """
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    table_pat = re.compile(r"\\begin\{table\*?\}[\s\S]*?\\end\{table\*?\}", re.DOTALL)
-
-    def build_table_png(block: str) -> tuple[str | None, str | None, Path | None]:
-        lab_m = re.search(r"\\label\{(tab:[^}]+)\}", block)
-        cap_m = re.search(r"\\caption\{([\s\S]*?)\}", block)
+    def build_table_png(block: str, inner: str) -> tuple[str | None, str | None, Path | None]:
+        lab_m = TAB_LABEL_RE.search(block)
+        cap_m = CAPTION_RE.search(block)
         label = lab_m.group(1).strip() if lab_m else None
         caption = cap_m.group(1).strip() if cap_m else None
         if not label:
             return (None, None, None)
 
-        # extract inner content (remove outer table env, caption, label)
-        inner = re.sub(r"^\\begin\{table\*?\}(?:\[[^\]]*\])?\s*", "", block, flags=re.DOTALL)
-        inner = re.sub(r"\\end\{table\*?\}\s*$", "", inner, flags=re.DOTALL)
+        # inner content (outer table env already stripped by TABLE_BODY_RE); remove caption, label
         inner = remove_braced_command(inner, "caption")
-        inner = re.sub(rf"\\label\{{{re.escape(label)}\}}\s*", "", inner)
-        inner = replace_cites(inner, cite_map)
-        inner = replace_refs(inner, ref_map)
+        inner = _label_strip_re(label).sub("", inner)
+        inner = resolve_refs_cites(inner, ref_map, cite_map)
 
         standalone = (
             "\\documentclass[preview]{standalone}\n"
@@ -508,10 +634,18 @@ def tables_to_images_for_word(
             "\\end{document}\n"
         )
 
-        tmp_dir = docs / "_docx_tmp"
-        tmp_dir.mkdir(parents=True, exist_ok=True)
         safe = label.replace(":", "_")
+        # Outputs are keyed by the standalone source + DPI, so unchanged tables skip latexmk/pdftocairo
+        # on re-export. Older outputs for the same label are removed once a new one is built.
+        key = hashlib.blake2b((standalone + str(dpi)).encode("utf-8"), digest_size=16).hexdigest()
+        out_png = out_dir / f"tab_{safe}_{key}.png"
+        if out_png.exists():
+            return (label, caption, out_png)
+
         job = f"_standalone_{safe}"
+        # Per-job subdirectory: builds run concurrently and latexmk aux files must not collide.
+        tmp_dir = docs / "_docx_tmp" / job
+        tmp_dir.mkdir(parents=True, exist_ok=True)
         tex_path = tmp_dir / f"{job}.tex"
         tex_path.write_text(standalone, encoding="utf-8")
 
@@ -530,15 +664,24 @@ def tables_to_images_for_word(
         if not pdf_path.exists():
             return (label, caption, None)
 
-        out_pdf = out_dir / f"tab_{safe}.pdf"
-        shutil.copy2(pdf_path, out_pdf)
-        out_png = out_dir / f"tab_{safe}.png"
+        out_pdf = out_dir / f"tab_{safe}_{key}.pdf"
+        # The job directory is ours and the output is content-keyed, so move instead of copying
+        # (falls back to a copy when out_dir is on another filesystem).
+        try:
+            os.replace(pdf_path, out_pdf)
+        except OSError:
+            shutil.copy2(pdf_path, out_pdf)
         rasterize_pdf_to_png(out_pdf, out_png, dpi)
+        stale_re = re.compile(rf"tab_{re.escape(safe)}_[0-9a-f]{{32}}")
+        for old in out_dir.glob(f"tab_{glob.escape(safe)}_*"):
+            if old.stem != out_png.stem and stale_re.fullmatch(old.stem):
+                old.unlink()
+        # Un-keyed outputs from before the content-keyed naming.
+        for ext in ("png", "pdf"):
+            (out_dir / f"tab_{safe}.{ext}").unlink(missing_ok=True)
         return (label, caption, out_png)
 
-    def repl(m: re.Match) -> str:
-        block = m.group(0)
-        label, caption, png = build_table_png(block)
+    def render(block: str, label: str | None, caption: str | None, png: Path | None) -> str:
         if not label or not png or not png.exists():
             return block  # fallback: keep original
         n = ref_map.get(label, "??")
@@ -550,15 +693,37 @@ def tables_to_images_for_word(
             f"\\includegraphics[width=\\linewidth]{{{rel}}}\\par\n"
         )
 
-    return table_pat.sub(repl, tex)
+    # Phase 1: collect tables; phase 2: build them (independent latexmk/pdftocairo jobs, run
+    # concurrently when there is more than one); phase 3: splice results back in source order.
+    # Table floats without a tabular (notes, boxed text) are left as-is and never reach latexmk.
+    matches = [m for m in TABLE_BODY_RE.finditer(tex) if "\\begin{tabular}" in m.group(1)]
+    if len(matches) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(matches), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(lambda m: build_table_png(m.group(0), m.group(1)), matches))
+    else:
+        results = [build_table_png(m.group(0), m.group(1)) for m in matches]
+
+    out: list[str] = []
+    pos = 0
+    for m, (label, caption, png) in zip(matches, results):
+        out.append(tex[pos : m.start()])
+        out.append(render(m.group(0), label, caption, png))
+        pos = m.end()
+    out.append(tex[pos:])
+    return "".join(out)
+
 
+# Everything simplify_tabular deletes or swaps for \hline, as one alternation: minipage header
+# wrappers, \noalign{} noise, \raggedright declarations and booktabs rules. \raggedright also
+# swallows deletable wrappers/noise after it, so whitespace they expose is eaten as before.
+_TABULAR_NOISE = MINIPAGE_WRAPPER_RE.pattern + r"|\\noalign\{[^}]*\}"
+TABULAR_CLEAN_RE = re.compile(
+    rf"\\raggedright(?:\s|{_TABULAR_NOISE})*|{_TABULAR_NOISE}|\\(?P<rule>top|mid|bottom)rule"
+)
 
-def _strip_minipage_wrappers(s: str) -> str:
-    # Remove common minipage wrappers used in table headers.
-    s = re.sub(r"\\begin\{minipage\}\[[^\]]*\]\{\\linewidth\}\s*", "", s, flags=re.DOTALL)
-    s = re.sub(r"\\begin\{minipage\}\{\\linewidth\}\s*", "", s, flags=re.DOTALL)
-    s = re.sub(r"\\end\{minipage\}\s*", "", s, flags=re.DOTALL)
-    return s
+
+def _tabular_clean_repl(m: re.Match) -> str:
+    return "\\hline" if m.group("rule") else ""
 
 
 def simplify_tables_for_pandoc(tex: str) -> str:
@@ -568,33 +733,42 @@ def simplify_tables_for_pandoc(tex: str) -> str:
     into real Word table objects (w:tbl) with populated cells.
     """
     def simplify_tabular(tab: str) -> str:
-        # Normalize header/cell wrappers.
-        tab = _strip_minipage_wrappers(tab)
-        # Remove \noalign{} noise.
-        tab = re.sub(r"\\noalign\{[^}]*\}", "", tab)
-        # Replace booktabs rules with simple hlines for pandoc.
-        tab = tab.replace("\\toprule", "\\hline")
-        tab = tab.replace("\\midrule", "\\hline")
-        tab = tab.replace("\\bottomrule", "\\hline")
+        # Normalize header/cell wrappers, remove \noalign{} noise and raggedright declarations that
+        # confuse parsing, and replace booktabs rules with simple hlines for pandoc, in one scan.
+        tab = TABULAR_CLEAN_RE.sub(_tabular_clean_repl, tab)
         # Remove column spec complexity: replace the entire balanced {...} spec with plain l-columns.
         def count_cols(spec: str) -> int:
+            # Fast path: tokenize the spec in one regex pass. SPEC_TOKEN_RE only understands brace
+            # groups nested two deep, so anything deeper (or unbalanced) takes the char-by-char scan.
+            depth = 0
+            for m in BRACE_RE.finditer(spec):
+                depth += 1 if m.group() == "{" else -1
+                if depth > 2 or depth < 0:
+                    return count_cols_slow(spec)
+            if depth != 0:
+                return count_cols_slow(spec)
+
+            cols = 0
+            for m in SPEC_TOKEN_RE.finditer(spec):
+                tok = m.group()
+                if tok[0] in "lcrpmb":
+                    cols += 1
+                elif m.group("inner") is not None:
+                    try:
+                        rep = int(m.group("rep").strip())
+                    except Exception:
+                        rep = 1
+                    cols += rep * count_cols(m.group("inner"))
+            return cols
+
+        def count_cols_slow(spec: str) -> int:
             i = 0
             cols = 0
             n = len(spec)
 
             def skip_braced(start: int) -> int:
                 # spec[start] should be '{'
-                j = start
-                depth = 0
-                while j < n:
-                    if spec[j] == "{":
-                        depth += 1
-                    elif spec[j] == "}":
-                        depth -= 1
-                        if depth == 0:
-                            return j + 1
-                    j += 1
-                return j
+                return _skip_balanced_braces(spec, start + 1)
 
             while i < n:
                 ch = spec[i]
@@ -645,34 +819,23 @@ def simplify_tables_for_pandoc(tex: str) -> str:
         begin_marker = "\\begin{tabular}{"
         bidx = tab.find(begin_marker)
         if bidx != -1:
-            j = bidx + len(begin_marker)
-            depth = 1
-            while j < len(tab) and depth > 0:
-                ch = tab[j]
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                j += 1
+            j = _skip_balanced_braces(tab, bidx + len(begin_marker))
             full_begin = tab[bidx:j]  # includes closing }
             spec = tab[bidx + len(begin_marker) : j - 1]
             # Count columns by counting occurrences of p{...} or alignment tokens.
             cols = count_cols(spec)
             if cols == 0:
-                first_row = re.search(r"\\begin\{tabular\}[\s\S]*?\n([^\n]+)", tab)
+                first_row = TABULAR_FIRST_ROW_RE.search(tab)
                 if first_row:
                     cols = first_row.group(1).count("&") + 1
             cols = max(cols, 2)
             new_spec = "l" * cols
             tab = tab.replace(full_begin, f"\\begin{{tabular}}{{{new_spec}}}", 1)
-        # Remove explicit raggedright declarations that confuse parsing.
-        tab = re.sub(r"\\raggedright\s*", "", tab)
         # Collapse excessive whitespace.
-        tab = re.sub(r"\n{3,}", "\n\n", tab)
+        tab = BLANK_LINES_RE.sub("\n\n", tab)
         return tab
 
     # Rewrite each table environment's tabular.
-    table_pat = re.compile(r"(\\begin\{table\*?\}[\s\S]*?\\end\{table\*?\})", re.DOTALL)
 
     def repl(m: re.Match) -> str:
         block = m.group(1)
@@ -680,13 +843,13 @@ def simplify_tables_for_pandoc(tex: str) -> str:
         if "\\begin{tabular}" not in block:
             return block
         # Simplify only the tabular portion.
-        block = re.sub(r"(\\begin\{tabular\}[\s\S]*?\\end\{tabular\})", lambda mm: simplify_tabular(mm.group(1)), block)
+        block = TABULAR_ENV_RE.sub(lambda mm: simplify_tabular(mm.group(1)), block)
         return block
 
-    return table_pat.sub(repl, tex)
+    return TABLE_ENV_RE.sub(repl, tex)
 
 
-def to_roman(n: int) -> str:
+def _to_roman_slow(n: int) -> str:
     vals = [
         (1000, "M"),
         (900, "CM"),
@@ -710,18 +873,21 @@ def to_roman(n: int) -> str:
     return "".join(out) or "I"
 
 
+# Table/figure numbers in a paper stay small; look those up instead of rebuilding them per caption.
+ROMAN_TABLE = [""] + [_to_roman_slow(i) for i in range(1, 100)]
+
+
+def to_roman(n: int) -> str:
+    if 1 <= n < len(ROMAN_TABLE):
+        return ROMAN_TABLE[n]
+    return _to_roman_slow(n)
+
+
 def _prefix_caption_in_block(block: str, prefix: str) -> str:
     cidx = block.find("\\caption{")
     if cidx == -1:
         return block
-    j = cidx + len("\\caption{")
-    depth = 1
-    while j < len(block) and depth > 0:
-        if block[j] == "{":
-            depth += 1
-        elif block[j] == "}":
-            depth -= 1
-        j += 1
+    j = _skip_balanced_braces(block, cidx + len("\\caption{"))
     caption = block[cidx + len("\\caption{") : j - 1]
     if caption.strip().startswith(prefix.split()[0]):
         return block
@@ -737,7 +903,7 @@ def prefix_table_and_figure_captions_in_envs(tex: str, ref_map: dict[str, str])
     # Tables
     def table_repl(m: re.Match) -> str:
         block = m.group(1)
-        lm = re.search(r"\\label\{(tab:[^}]+)\}", block)
+        lm = TAB_LABEL_RE.search(block)
         if not lm:
             return block
         lab = lm.group(1)
@@ -748,19 +914,19 @@ def prefix_table_and_figure_captions_in_envs(tex: str, ref_map: dict[str, str])
             roman = str(num)
         return _prefix_caption_in_block(block, f"TABLE {roman}. ")
 
-    tex = re.sub(r"(\\begin\{table\*?\}[\s\S]*?\\end\{table\*?\})", table_repl, tex)
+    tex = TABLE_ENV_RE.sub(table_repl, tex)
 
     # Figures
     def fig_repl(m: re.Match) -> str:
         block = m.group(1)
-        lm = re.search(r"\\label\{(fig:[^}]+)\}", block)
+        lm = FIG_LABEL_RE.search(block)
         if not lm:
             return block
         lab = lm.group(1)
         num = ref_map.get(lab, "??")
         return _prefix_caption_in_block(block, f"Fig. {num}. ")
 
-    tex = re.sub(r"(\\begin\{figure\*?\}[\s\S]*?\\end\{figure\*?\})", fig_repl, tex)
+    tex = FIGURE_ENV_RE.sub(fig_repl, tex)
     return tex
 
 
@@ -770,33 +936,24 @@ def flatten_table_captions_for_pandoc(tex: str) -> str:
     For DOCX export we turn \\caption{...}\\label{...} into an explicit paragraph
     directly above the tabular, so the caption exists as editable text in Word.
     """
-    table_pat = re.compile(r"(\\begin\{table\*?\}[\s\S]*?\\end\{table\*?\})", re.DOTALL)
-
     def repl(m: re.Match) -> str:
         block = m.group(1)
         # Extract caption (balanced)
         cidx = block.find("\\caption{")
         if cidx == -1:
             return block
-        j = cidx + len("\\caption{")
-        depth = 1
-        while j < len(block) and depth > 0:
-            if block[j] == "{":
-                depth += 1
-            elif block[j] == "}":
-                depth -= 1
-            j += 1
+        j = _skip_balanced_braces(block, cidx + len("\\caption{"))
         caption = block[cidx + len("\\caption{") : j - 1].strip()
 
         # Extract label (simple)
-        lm = re.search(r"\\label\{(tab:[^}]+)\}", block)
+        lm = TAB_LABEL_RE.search(block)
         label = lm.group(1) if lm else None
 
         # Remove caption and label commands from block (best-effort)
         block_wo = block
         block_wo = remove_braced_command(block_wo, "caption")
         if label:
-            block_wo = re.sub(rf"\\label\{{{re.escape(label)}\}}\s*", "", block_wo)
+            block_wo = _label_strip_re(label).sub("", block_wo)
 
         # Insert explicit caption paragraph before first tabular
         ins = f"\\noindent\\textit{{{caption}}}\\par\n"
@@ -807,7 +964,133 @@ def flatten_table_captions_for_pandoc(tex: str) -> str:
             block_wo = ins + block_wo
         return block_wo
 
-    return table_pat.sub(repl, tex)
+    return TABLE_ENV_RE.sub(repl, tex)
+
+
+W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+# Clark-notation tags for the WordprocessingML elements touched per paragraph, built once.
+W_P = f"{{{W_NS['w']}}}p"
+W_PPR = f"{{{W_NS['w']}}}pPr"
+W_PSTYLE = f"{{{W_NS['w']}}}pStyle"
+W_VAL = f"{{{W_NS['w']}}}val"
+W_R = f"{{{W_NS['w']}}}r"
+W_RPR = f"{{{W_NS['w']}}}rPr"
+W_T = f"{{{W_NS['w']}}}t"
+W_NUMPR = f"{{{W_NS['w']}}}numPr"
+W_ILVL = f"{{{W_NS['w']}}}ilvl"
+W_NUMID = f"{{{W_NS['w']}}}numId"
+W_SECTPR = f"{{{W_NS['w']}}}sectPr"
+W_BODY = f"{{{W_NS['w']}}}body"
+if _HAVE_LXML:
+    P_STYLE_XPATH = ET.XPath("./w:pPr/w:pStyle/@w:val", namespaces=W_NS, smart_strings=False)
+    P_TEXT_XPATH = ET.XPath(".//w:t/text()", namespaces=W_NS, smart_strings=False)
+    # huge_tree lifts libxml2's hard limits (text node size, tree depth) that a large
+    # document.xml can trip; the parser is only used from the single-threaded postprocess.
+    DOCX_XML_PARSER = ET.XMLParser(huge_tree=True)
+
+
+def _parse_docx_part(data: bytes):
+    if _HAVE_LXML:
+        return ET.fromstring(data, DOCX_XML_PARSER)
+    return ET.fromstring(data)
+
+
+# IEEE-like heading numbering (abstractNum 20001 / num 2001), grafted into numbering.xml.
+HEADING_NUMBERING_XML = (
+    '<w:numbering xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:abstractNum w:abstractNumId="20001">'
+    '<w:multiLevelType w:val="multilevel"/>'
+    # Level 0: I.
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="upperRoman"/><w:lvlText w:val="%1."/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="0"/></w:pPr></w:lvl>'
+    # Level 1: A.
+    '<w:lvl w:ilvl="1"><w:start w:val="1"/><w:numFmt w:val="upperLetter"/><w:lvlText w:val="%2."/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="0"/></w:pPr></w:lvl>'
+    # Level 2: 1)
+    '<w:lvl w:ilvl="2"><w:start w:val="1"/><w:numFmt w:val="decimal"/><w:lvlText w:val="%3."/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="0"/></w:pPr></w:lvl>'
+    "</w:abstractNum>"
+    '<w:num w:numId="2001"><w:abstractNumId w:val="20001"/></w:num>'
+    "</w:numbering>"
+)
+
+
+# styles.xml / document.xml rewrite patterns, compiled once.
+DOCDEFAULTS_RPR_RE = re.compile(
+    r"(<w:docDefaults>[\s\S]*?<w:rPrDefault>[\s\S]*?<w:rPr>)[\s\S]*?(</w:rPr>[\s\S]*?</w:rPrDefault>)"
+)
+DOCDEFAULTS_PPR_RE = re.compile(r"(<w:pPrDefault>[\s\S]*?<w:pPr>)[\s\S]*?(</w:pPr>[\s\S]*?</w:pPrDefault>)")
+BODYTEXT_PPR_RE = re.compile(r"(<w:style[^>]*w:styleId=\"BodyText\"[\s\S]*?<w:pPr>)[\s\S]*?(</w:pPr>)")
+# Self-closing run/paragraph property tags the style patchers rewrite, as one alternation; each
+# patcher maps the group names it cares about to a replacement (see _rewrite_style_tags). Every
+# alternative spans a single tag, so one left-to-right scan equals the former per-pattern passes.
+# The abstract_* alternatives keep the Abstract patcher's original (escaped) patterns verbatim.
+STYLE_TAG_RE = re.compile(
+    r"(?P<abstract_sz><w:sz w:val=\"\\d+\"\\s*/>)"
+    r"|(?P<abstract_szcs><w:szCs w:val=\"\\d+\"\\s*/>)"
+    r"|(?P<sz><w:sz\s+[^>]*w:val=\"\d+\"[^>]*/>)"
+    r"|(?P<szcs><w:szCs\s+[^>]*w:val=\"\d+\"[^>]*/>)"
+    r"|(?P<rfonts><w:rFonts[^>]*/>)"
+    r"|(?P<spacing><w:spacing[^>]*/>)"
+    r"|(?P<color><w:color[^>]*/>)"
+    r"|(?P<b><w:b[^>]*/>)"
+    r"|(?P<i><w:i[^>]*/>)"
+)
+# Already-numbered heading text: "IV. ..." (any level) or, via the letter group, "B. ..." (sub-levels).
+HEADING_NUMBER_PREFIX_RE = re.compile(r"^\s*(?:[IVXLCDM]+|(?P<letter>[A-Z]))\.\s+")
+HEADING_LEVELS = {"Heading1": "0", "Heading2": "1", "Heading3": "2"}
+# Stored casefolded; compare against txt.strip().casefold() so pandoc's casing does not matter.
+UNNUMBERED_HEADINGS = frozenset(
+    {
+        "references",
+        "acknowledgment",
+        "data and artifact availability",
+        "conflict of interest",
+        "appendix",
+    }
+)
+TABLE_CAPTION_TEXT_RE = re.compile(r"^\\s*TABLE\\s+[IVXLCDM]+\\.\\s*(.*)$")
+
+
+def _rewrite_style_tags(block: str, repl: dict[str, str]) -> str:
+    # Replace the tags whose STYLE_TAG_RE group is in repl; everything else is left untouched.
+    def _sub(m: re.Match) -> str:
+        return repl.get(m.lastgroup, m.group(0))
+
+    return STYLE_TAG_RE.sub(_sub, block)
+
+
+STYLE_START_RE = re.compile(r"<w:style[^>]*w:styleId=\"([^\"]*)\"")
+
+
+def _index_style_blocks(styles: str) -> tuple[list[str], dict[str, int]]:
+    """
+    Split styles.xml into pieces so each <w:style ...>...</w:style> block is its own list item,
+    and map styleId -> piece index (first occurrence, like a leftmost regex search would).
+    Patching a style then touches only its block; the pieces are joined once at the end.
+    """
+    pieces: list[str] = []
+    blocks: dict[str, int] = {}
+    pos = 0
+    for m in STYLE_START_RE.finditer(styles):
+        if m.start() < pos:
+            # Start tag inside the previous block (unterminated style): leave it to that block.
+            continue
+        end = styles.find("</w:style>", m.start())
+        if end == -1:
+            break
+        end += len("</w:style>")
+        pieces.append(styles[pos : m.start()])
+        blocks.setdefault(m.group(1), len(pieces))
+        pieces.append(styles[m.start() : end])
+        pos = end
+    pieces.append(styles[pos:])
+    return pieces, blocks
+
+
+# Media that is already compressed; deflating it again costs CPU for no size gain.
+STORED_MEDIA_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".pdf", ".mp4"})
+
 
 def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None) -> None:
     """
@@ -818,36 +1101,19 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
     - Captions italic, 9pt
     - Headings black (remove theme accent color)
     """
-    with tempfile.TemporaryDirectory() as td:
-        td_path = Path(td)
-
-        with zipfile.ZipFile(docx_path, "r") as z:
-            z.extractall(td_path)
-
-        doc_xml_path = td_path / "word" / "document.xml"
-        styles_xml_path = td_path / "word" / "styles.xml"
-        numbering_xml_path = td_path / "word" / "numbering.xml"
-
-        if doc_xml_path.exists():
-            doc_xml = doc_xml_path.read_text("utf-8", errors="ignore")
-            # Insert pgSz/pgMar/cols into the *final* sectPr if missing.
-            def _sect_repl(m: re.Match) -> str:
-                sect = m.group(0)
-                insert = (
-                    '<w:pgSz w:w="12240" w:h="15840"/>'
-                    '<w:pgMar w:top="1080" w:right="1080" w:bottom="1080" w:left="1080" '
-                    'w:header="720" w:footer="720" w:gutter="0"/>'
-                    '<w:cols w:num="2" w:space="360"/>'
-                )
-                if "<w:cols" in sect:
-                    return sect
-                # Put before footnotePr if present, else right after sectPr open.
-                if "<w:footnotePr" in sect:
-                    return sect.replace("<w:footnotePr", insert + "<w:footnotePr", 1)
-                return sect.replace("<w:sectPr>", "<w:sectPr>" + insert, 1)
-
-            doc_xml = re.sub(r"<w:sectPr>[\s\S]*?</w:sectPr>", _sect_repl, doc_xml, count=1)
-
+    # Only the three XML parts we patch are read into memory; everything else (media, fonts, ...)
+    # is streamed member-by-member into the repacked archive, with no extract-to-disk round trip.
+    doc_xml_name = "word/document.xml"
+    styles_xml_name = "word/styles.xml"
+    numbering_xml_name = "word/numbering.xml"
+    tmp_out = docx_path.with_suffix(".tmp.docx")
+
+    with zipfile.ZipFile(docx_path, "r") as src:
+        names = set(src.namelist())
+        patched: dict[str, bytes] = {}
+
+        if doc_xml_name in names:
+            doc_bytes = src.read(doc_xml_name)
             # Make front matter (Title/Author/Abstract/Keywords) single-column, then switch to 2-col at body.
             # We insert a continuous section break (1-col) at the Keywords paragraph (style FirstParagraph,
             # immediately before the first Heading1 "Introduction" paragraph).
@@ -856,74 +1122,133 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
             # paragraph in the previous section.
             ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
             try:
-                import xml.etree.ElementTree as ET
-
-                root = ET.fromstring(doc_xml)
-                body = root.find(f"{{{ns_w}}}body")
+                # Parse the raw part bytes (lxml rejects str input carrying an encoding declaration).
+                root = _parse_docx_part(doc_bytes)
+                body = root.find(W_BODY)
                 if body is not None:
-                    paras = [p for p in body.findall(f"{{{ns_w}}}p")]
+                    # Insert pgSz/pgMar/cols into the *final* (body-level) sectPr if missing, directly
+                    # in the tree so document.xml is parsed and serialized only once.
+                    final_sect = body.find(W_SECTPR)
+                    if final_sect is not None and final_sect.find(f"{{{ns_w}}}cols") is None:
+                        pg_sz = ET.Element(f"{{{ns_w}}}pgSz")
+                        pg_sz.set(f"{{{ns_w}}}w", "12240")
+                        pg_sz.set(f"{{{ns_w}}}h", "15840")
+                        pg_mar = ET.Element(f"{{{ns_w}}}pgMar")
+                        for attr, val in (
+                            ("top", "1080"),
+                            ("right", "1080"),
+                            ("bottom", "1080"),
+                            ("left", "1080"),
+                            ("header", "720"),
+                            ("footer", "720"),
+                            ("gutter", "0"),
+                        ):
+                            pg_mar.set(f"{{{ns_w}}}{attr}", val)
+                        sect_cols = ET.Element(f"{{{ns_w}}}cols")
+                        sect_cols.set(f"{{{ns_w}}}num", "2")
+                        sect_cols.set(f"{{{ns_w}}}space", "360")
+                        # Put before footnotePr if present, else right after sectPr open.
+                        at = 0
+                        for idx, child in enumerate(final_sect):
+                            if child.tag == f"{{{ns_w}}}footnotePr":
+                                at = idx
+                                break
+                        final_sect[at:at] = [pg_sz, pg_mar, sect_cols]
+
+                    paras = [p for p in body.findall(W_P)]
+
+                    if _HAVE_LXML:
+                        # Precompiled XPath: one C-level call per paragraph.
+                        def _read_p_style(p):
+                            vals = P_STYLE_XPATH(p)
+                            return vals[0] if vals else None
+
+                        def _read_p_text(p):
+                            return "".join(P_TEXT_XPATH(p)).strip()
+
+                    else:
+
+                        def _read_p_style(p):
+                            pPr = p.find(W_PPR)
+                            if pPr is None:
+                                return None
+                            ps = pPr.find(W_PSTYLE)
+                            return ps.get(W_VAL) if ps is not None else None
+
+                        def _read_p_text(p):
+                            # iter() walks the subtree directly; findall(".//...") goes through ElementPath.
+                            return "".join(t.text for t in p.iter(W_T) if t.text).strip()
+
+                    # The intro search, author insertion and paragraph scan all ask for the same paragraphs'
+                    # style/text; memoize per element (keyed by id(), paras keeps them alive) and drop an
+                    # entry whenever a paragraph's style or runs are rewritten.
+                    style_cache: dict[int, str | None] = {}
+                    text_cache: dict[int, str] = {}
 
                     def _p_style(p):
-                        pPr = p.find(f"{{{ns_w}}}pPr")
-                        if pPr is None:
-                            return None
-                        ps = pPr.find(f"{{{ns_w}}}pStyle")
-                        return ps.get(f"{{{ns_w}}}val") if ps is not None else None
+                        k = id(p)
+                        if k not in style_cache:
+                            style_cache[k] = _read_p_style(p)
+                        return style_cache[k]
 
                     def _p_text(p):
-                        texts = []
-                        for t in p.findall(f".//{{{ns_w}}}t"):
-                            if t.text:
-                                texts.append(t.text)
-                        return "".join(texts).strip()
+                        k = id(p)
+                        if k not in text_cache:
+                            text_cache[k] = _read_p_text(p)
+                        return text_cache[k]
 
                     def _ensure_pPr(p):
-                        pPr = p.find(f"{{{ns_w}}}pPr")
+                        pPr = p.find(W_PPR)
                         if pPr is None:
-                            pPr = ET.Element(f"{{{ns_w}}}pPr")
+                            pPr = ET.Element(W_PPR)
                             p.insert(0, pPr)
                         return pPr
 
                     def _set_p_style(p, style_id: str) -> None:
                         pPr = _ensure_pPr(p)
-                        ps = pPr.find(f"{{{ns_w}}}pStyle")
+                        ps = pPr.find(W_PSTYLE)
                         if ps is None:
-                            ps = ET.SubElement(pPr, f"{{{ns_w}}}pStyle")
-                        ps.set(f"{{{ns_w}}}val", style_id)
+                            ps = ET.SubElement(pPr, W_PSTYLE)
+                        ps.set(W_VAL, style_id)
+                        style_cache.pop(id(p), None)
 
                     def _apply_num(p, num_id: str, ilvl: str) -> None:
                         pPr = _ensure_pPr(p)
-                        numPr = pPr.find(f"{{{ns_w}}}numPr")
+                        numPr = pPr.find(W_NUMPR)
                         if numPr is None:
-                            numPr = ET.SubElement(pPr, f"{{{ns_w}}}numPr")
-                        il = numPr.find(f"{{{ns_w}}}ilvl")
+                            numPr = ET.SubElement(pPr, W_NUMPR)
+                        il = numPr.find(W_ILVL)
                         if il is None:
-                            il = ET.SubElement(numPr, f"{{{ns_w}}}ilvl")
-                        il.set(f"{{{ns_w}}}val", ilvl)
-                        nid = numPr.find(f"{{{ns_w}}}numId")
+                            il = ET.SubElement(numPr, W_ILVL)
+                        il.set(W_VAL, ilvl)
+                        nid = numPr.find(W_NUMID)
                         if nid is None:
-                            nid = ET.SubElement(numPr, f"{{{ns_w}}}numId")
-                        nid.set(f"{{{ns_w}}}val", num_id)
-
-                    intro_idx = None
-                    for i, p in enumerate(paras):
-                        if _p_style(p) == "Heading1" and _p_text(p).strip() == "Introduction":
-                            intro_idx = i
-                            break
-
-                    if intro_idx is not None and intro_idx > 0:
+                            nid = ET.SubElement(numPr, W_NUMID)
+                        nid.set(W_VAL, num_id)
+
+                    def _find_intro():
+                        # Stream body paragraphs and stop at the first Heading1 "Introduction";
+                        # text is only gathered for Heading1 paragraphs.
+                        prev = None
+                        for p in body.iterfind(W_P):
+                            if _p_style(p) == "Heading1" and _p_text(p).strip() == "Introduction":
+                                return prev, p
+                            prev = p
+                        return None, None
+
+                    kw_p, intro_p = _find_intro()
+                    if kw_p is not None:
                         # The paragraph immediately before Introduction is where we put the sectPr.
-                        kw_p = paras[intro_idx - 1]
-                        kw_pPr = kw_p.find(f"{{{ns_w}}}pPr")
+                        kw_pPr = kw_p.find(W_PPR)
                         if kw_pPr is None:
-                            kw_pPr = ET.Element(f"{{{ns_w}}}pPr")
+                            kw_pPr = ET.Element(W_PPR)
                             kw_p.insert(0, kw_pPr)
 
                         # Avoid adding multiple times.
-                        existing = kw_pPr.find(f"{{{ns_w}}}sectPr")
+                        existing = kw_pPr.find(W_SECTPR)
                         if existing is None:
-                            sectPr = ET.SubElement(kw_pPr, f"{{{ns_w}}}sectPr")
-                            ET.SubElement(sectPr, f"{{{ns_w}}}type").set(f"{{{ns_w}}}val", "continuous")
+                            sectPr = ET.SubElement(kw_pPr, W_SECTPR)
+                            ET.SubElement(sectPr, f"{{{ns_w}}}type").set(W_VAL, "continuous")
                             ET.SubElement(sectPr, f"{{{ns_w}}}pgSz").set(f"{{{ns_w}}}w", "12240")
                             sectPr.find(f"{{{ns_w}}}pgSz").set(f"{{{ns_w}}}h", "15840")
                             mar = ET.SubElement(sectPr, f"{{{ns_w}}}pgMar")
@@ -939,14 +1264,14 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                             cols.set(f"{{{ns_w}}}space", "360")
 
                     def _prepend_paragraph_text(p, prefix: str) -> None:
-                        t = p.find(f".//{{{ns_w}}}t")
+                        t = p.find(".//" + W_T)
                         if t is not None:
                             t.text = prefix + (t.text or "")
                             return
-                        r = p.find(f"{{{ns_w}}}r")
+                        r = p.find(W_R)
                         if r is None:
-                            r = ET.SubElement(p, f"{{{ns_w}}}r")
-                        t = ET.SubElement(r, f"{{{ns_w}}}t")
+                            r = ET.SubElement(p, W_R)
+                        t = ET.SubElement(r, W_T)
                         t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
                         t.text = prefix
 
@@ -954,94 +1279,52 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                     # so we MUST NOT auto-prefix again here (it would create "Fig. 1. Fig. 1. ...").
 
                     # Insert IEEE-like author block lines (affiliation/email) right after the first Author paragraph.
+                    # Walk body children directly so insert_at is a body index (not a paras index)
+                    # and no per-insert list(body).index(...) lookup is needed.
                     if author_lines:
-                        for i, p in enumerate(paras):
-                            if _p_style(p) == "Author":
-                                insert_at = i + 1
+                        for i, child in enumerate(body):
+                            if child.tag == W_P and _p_style(child) == "Author":
+                                anchor, insert_at = child, i + 1
                                 for line in author_lines:
                                     line = line.strip()
                                     if not line:
                                         continue
-                                    np = ET.Element(f"{{{ns_w}}}p")
-                                    pPr = ET.SubElement(np, f"{{{ns_w}}}pPr")
-                                    ET.SubElement(pPr, f"{{{ns_w}}}pStyle").set(f"{{{ns_w}}}val", "Author")
-                                    r = ET.SubElement(np, f"{{{ns_w}}}r")
-                                    t = ET.SubElement(r, f"{{{ns_w}}}t")
+                                    np = ET.Element(W_P)
+                                    pPr = ET.SubElement(np, W_PPR)
+                                    ET.SubElement(pPr, W_PSTYLE).set(W_VAL, "Author")
+                                    r = ET.SubElement(np, W_R)
+                                    t = ET.SubElement(r, W_T)
                                     t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
                                     t.text = line
-                                    body.insert(insert_at, np)
-                                    insert_at += 1
+                                    if _HAVE_LXML:
+                                        # Sibling insertion, no index bookkeeping.
+                                        anchor.addnext(np)
+                                        anchor = np
+                                    else:
+                                        body.insert(insert_at, np)
+                                        insert_at += 1
                                 break
 
                     # Reformat Abstract/Keywords to IEEE-style labels and remove the centered AbstractTitle line.
                     # AbstractTitle paragraph (style AbstractTitle) is removed; Abstract paragraph is prefixed with "Abstract—".
                     def _prepend_label(paragraph, label_text: str, bold: bool = False, italic: bool = False):
                         # Create a new run at the beginning.
-                        r = ET.Element(f"{{{ns_w}}}r")
-                        rPr = ET.SubElement(r, f"{{{ns_w}}}rPr")
+                        r = ET.Element(W_R)
+                        rPr = ET.SubElement(r, W_RPR)
                         if bold:
                             ET.SubElement(rPr, f"{{{ns_w}}}b")
                         if italic:
                             ET.SubElement(rPr, f"{{{ns_w}}}i")
-                        t = ET.SubElement(r, f"{{{ns_w}}}t")
+                        t = ET.SubElement(r, W_T)
                         t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
                         t.text = label_text
+                        # Position 0 (ahead of pPr) as before: an O(1) link under lxml.
                         paragraph.insert(0, r)
-
-                    # Remove AbstractTitle
-                    for p in list(paras):
-                        if _p_style(p) == "AbstractTitle":
-                            body.remove(p)
-                            break
-
-                    # Prefix Abstract
-                    for p in paras:
-                        if _p_style(p) == "Abstract":
-                            _prepend_label(p, "Abstract— ", bold=True, italic=False)
-                            break
-
-                    # Prefix Keywords: treat the FirstParagraph immediately after Abstract as keywords.
-                    # Set its style to IndexTerms (we will define this style in styles.xml).
-                    for i, p in enumerate(paras):
-                        if _p_style(p) == "Abstract":
-                            if i + 1 < len(paras):
-                                kw = paras[i + 1]
-                                _prepend_label(kw, "Index Terms— ", bold=False, italic=True)
-                                _set_p_style(kw, "IndexTerms")
-                            break
+                        text_cache.pop(id(paragraph), None)
 
                     # Apply IEEE-like multi-level heading numbering (Roman for sections, A/B/C for subsections).
                     # Important: do NOT number unnumbered sections (REFERENCES/Acknowledgment/etc.).
                     heading_num_id = "2001"
-                    unnumbered = {
-                        "REFERENCES",
-                        "Acknowledgment",
-                        "ACKNOWLEDGMENT",
-                        "Data and Artifact Availability",
-                        "Conflict of Interest",
-                        "APPENDIX",
-                    }
-                    for p in paras:
-                        st = _p_style(p)
-                        if st not in ("Heading1", "Heading2", "Heading3"):
-                            continue
-                        txt = _p_text(p)
-                        if not txt:
-                            continue
-                        if txt.strip() in unnumbered:
-                            continue
-                        # Skip already-numbered headings (e.g., "I. INTRODUCTION")
-                        if re.match(r"^\s*[IVXLCDM]+\.\s+", txt):
-                            continue
-                        if re.match(r"^\s*[A-Z]\.\s+", txt) and st != "Heading1":
-                            continue
-
-                        if st == "Heading1":
-                            _apply_num(p, heading_num_id, "0")
-                        elif st == "Heading2":
-                            _apply_num(p, heading_num_id, "1")
-                        else:
-                            _apply_num(p, heading_num_id, "2")
 
                     # Convert "TABLE ..." caption paragraphs into Word field-based captions so they are editable
                     # and can be auto-renumbered by Word/production.
@@ -1049,48 +1332,93 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                     # Input (from pandoc): a paragraph whose visible text begins with "TABLE II. ..."
                     # Output: "TABLE " + SEQ Table \\* ROMAN + ". " + caption rest
                     def _clear_runs_keep_ppr(paragraph):
-                        for child in list(paragraph):
-                            if child.tag != f"{{{ns_w}}}pPr":
-                                paragraph.remove(child)
+                        # One slice assignment instead of a remove() (search + shift) per child.
+                        paragraph[:] = [child for child in paragraph if child.tag == W_PPR]
+                        text_cache.pop(id(paragraph), None)
 
                     def _append_text_run(paragraph, text: str):
-                        r = ET.SubElement(paragraph, f"{{{ns_w}}}r")
-                        t = ET.SubElement(r, f"{{{ns_w}}}t")
+                        r = ET.SubElement(paragraph, W_R)
+                        t = ET.SubElement(r, W_T)
                         t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
                         t.text = text
+                        text_cache.pop(id(paragraph), None)
 
                     def _append_seq_field(paragraph, seq_name: str, switches: str, placeholder: str = "I"):
                         fld = ET.SubElement(paragraph, f"{{{ns_w}}}fldSimple")
                         fld.set(f"{{{ns_w}}}instr", f" SEQ {seq_name} {switches} ")
-                        r = ET.SubElement(fld, f"{{{ns_w}}}r")
-                        t = ET.SubElement(r, f"{{{ns_w}}}t")
+                        r = ET.SubElement(fld, W_R)
+                        t = ET.SubElement(r, W_T)
                         t.text = placeholder
+                        text_cache.pop(id(paragraph), None)
 
-                    for p in paras:
-                        txt = _p_text(p)
-                        m = re.match(r"^\\s*TABLE\\s+[IVXLCDM]+\\.\\s*(.*)$", txt)
-                        if not m:
+                    # One scan over the paragraphs: style is read once per paragraph and text only where a
+                    # rule needs it; the edits are applied afterwards, in the same order as before.
+                    abstract_title_p = abstract_idx = None
+                    headings: list[tuple] = []
+                    table_captions: list[tuple] = []
+                    for i, p in enumerate(paras):
+                        st = _p_style(p)
+                        if st == "AbstractTitle":
+                            if abstract_title_p is None:
+                                abstract_title_p = p
+                        elif st == "Abstract" and abstract_idx is None:
+                            abstract_idx = i
+                            continue
+                        if abstract_idx is not None and i == abstract_idx + 1:
+                            # Keywords paragraph: restyled to IndexTerms and prefixed, so it is neither
+                            # numbered nor taken as a TABLE caption.
                             continue
-                        rest = m.group(1).strip()
+                        txt = _p_text(p)
+                        lvl = HEADING_LEVELS.get(st)
+                        if lvl is not None and txt and txt.strip().casefold() not in UNNUMBERED_HEADINGS:
+                            # Skip already-numbered headings (e.g., "I. INTRODUCTION"; "A. ..." below Heading1)
+                            num = HEADING_NUMBER_PREFIX_RE.match(txt)
+                            if num is None or (num.group("letter") is not None and st == "Heading1"):
+                                headings.append((p, lvl))
+                        # C-level substring test first; only candidate captions reach the regex.
+                        m = TABLE_CAPTION_TEXT_RE.match(txt) if "TABLE" in txt else None
+                        if m:
+                            table_captions.append((p, m.group(1).strip()))
+
+                    if abstract_title_p is not None:
+                        body.remove(abstract_title_p)
+
+                    if abstract_idx is not None:
+                        _prepend_label(paras[abstract_idx], "Abstract— ", bold=True, italic=False)
+                        # Prefix Keywords: treat the FirstParagraph immediately after Abstract as keywords.
+                        # Set its style to IndexTerms (we will define this style in styles.xml).
+                        if abstract_idx + 1 < len(paras):
+                            kw = paras[abstract_idx + 1]
+                            _prepend_label(kw, "Index Terms— ", bold=False, italic=True)
+                            _set_p_style(kw, "IndexTerms")
+
+                    for p, ilvl in headings:
+                        _apply_num(p, heading_num_id, ilvl)
+
+                    for p, rest in table_captions:
                         _set_p_style(p, "Caption")
                         _clear_runs_keep_ppr(p)
                         _append_text_run(p, "TABLE ")
                         _append_seq_field(p, "Table", "\\\\* ROMAN", "I")
                         _append_text_run(p, ". " + rest)
 
-                    doc_xml = ET.tostring(root, encoding="utf-8", xml_declaration=False).decode("utf-8")
+                    # Serialize once, straight to the bytes that go into the zip, keeping the
+                    # declaration Word writes (standalone="yes" needs lxml; stdlib has no such option).
+                    if _HAVE_LXML:
+                        patched[doc_xml_name] = ET.tostring(
+                            root, encoding="UTF-8", xml_declaration=True, standalone=True
+                        )
+                    else:
+                        patched[doc_xml_name] = ET.tostring(root, encoding="UTF-8", xml_declaration=True)
             except Exception:
-                # If XML manipulation fails, keep the doc_xml as-is (best-effort).
+                # If XML manipulation fails, keep document.xml as-is (best-effort).
                 pass
 
-            doc_xml_path.write_text(doc_xml, "utf-8")
-
-        if styles_xml_path.exists():
-            styles = styles_xml_path.read_text("utf-8", errors="ignore")
+        if styles_xml_name in names:
+            styles = src.read(styles_xml_name).decode("utf-8", errors="ignore")
 
             # docDefaults: Times New Roman 10pt, single spacing, no extra after-spacing
-            styles = re.sub(
-                r"(<w:docDefaults>[\s\S]*?<w:rPrDefault>[\s\S]*?<w:rPr>)[\s\S]*?(</w:rPr>[\s\S]*?</w:rPrDefault>)",
+            styles = DOCDEFAULTS_RPR_RE.sub(
                 r"\1"
                 r'<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>'
                 r'<w:sz w:val="20"/><w:szCs w:val="20"/>'
@@ -1099,29 +1427,37 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                 styles,
                 count=1,
             )
-            styles = re.sub(
-                r"(<w:pPrDefault>[\s\S]*?<w:pPr>)[\s\S]*?(</w:pPr>[\s\S]*?</w:pPrDefault>)",
+            styles = DOCDEFAULTS_PPR_RE.sub(
                 r'\1<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>\2',
                 styles,
                 count=1,
             )
 
+            # From here on every edit is scoped to one style block: index the blocks once and patch
+            # them by styleId instead of re-scanning the whole part with a regex per style.
+            pieces, blocks = _index_style_blocks(styles)
+
+            def _patch_style(style_id: str, patch_fn) -> None:
+                i = blocks.get(style_id)
+                if i is not None:
+                    pieces[i] = patch_fn(pieces[i])
+
             # BodyText spacing: compact and single-spaced
-            styles = re.sub(
-                r"(<w:style[^>]*w:styleId=\"BodyText\"[\s\S]*?<w:pPr>)[\s\S]*?(</w:pPr>)",
-                r'\1<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>\2',
-                styles,
-                count=1,
-            )
+            bodytext_spacing = r'\1<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>\2'
+            i = blocks.get("BodyText")
+            if i is not None and BODYTEXT_PPR_RE.match(pieces[i]):
+                pieces[i] = BODYTEXT_PPR_RE.sub(bodytext_spacing, pieces[i], count=1)
+            else:
+                # No <w:pPr> inside the BodyText block: the match (if any) runs on into later
+                # styles, so apply it to the whole part as before and re-index.
+                styles = BODYTEXT_PPR_RE.sub(bodytext_spacing, "".join(pieces), count=1)
+                pieces, blocks = _index_style_blocks(styles)
 
             # Caption: italic, 9pt, compact spacing
-            def _caption_repl(m: re.Match) -> str:
-                block = m.group(0)
+            def _caption_patch(block: str) -> str:
                 # spacing
-                block = re.sub(
-                    r"<w:spacing[^>]*/>",
-                    '<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>',
-                    block,
+                block = _rewrite_style_tags(
+                    block, {"spacing": '<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>'}
                 )
                 # ensure rPr has Times + 8pt (closer to IEEE figure/table captions)
                 if "<w:rPr>" in block:
@@ -1133,52 +1469,37 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                     )
                 return block
 
-            styles = re.sub(
-                r"<w:style[^>]*w:styleId=\"Caption\"[\s\S]*?</w:style>",
-                _caption_repl,
-                styles,
-                count=1,
-            )
-
-            def _patch_style(styles_xml: str, style_id: str, patch_fn) -> str:
-                m = re.search(
-                    rf"(<w:style[^>]*w:styleId=\"{re.escape(style_id)}\".*?</w:style>)",
-                    styles_xml,
-                    flags=re.DOTALL,
-                )
-                if not m:
-                    return styles_xml
-                old = m.group(1)
-                new = patch_fn(old)
-                return styles_xml.replace(old, new, 1)
+            _patch_style("Caption", _caption_patch)
 
             # Title: closer to IEEE (24pt Times, bold)
             def _title_patch(block: str) -> str:
-                block = re.sub(
-                    r"<w:rFonts[^>]*/>",
-                    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>',
+                block = _rewrite_style_tags(
                     block,
+                    {
+                        "rfonts": '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>',
+                        "sz": "<w:sz w:val=\"48\"/>",
+                        "szcs": "<w:szCs w:val=\"48\"/>",
+                    },
                 )
-                block = re.sub(r"<w:sz\s+[^>]*w:val=\"\d+\"[^>]*/>", "<w:sz w:val=\"48\"/>", block)
-                block = re.sub(r"<w:szCs\s+[^>]*w:val=\"\d+\"[^>]*/>", "<w:szCs w:val=\"48\"/>", block)
                 if "<w:b" not in block:
                     block = block.replace("<w:rPr>", "<w:rPr><w:b/>", 1)
                 return block
 
-            styles = _patch_style(styles, "Title", _title_patch)
+            _patch_style("Title", _title_patch)
 
             # Author: 11pt Times, centered, not inheriting Title size.
             def _author_patch(block: str) -> str:
-                block = re.sub(r"<w:basedOn\s+w:val=\"[^\"]+\"\s*/>", "<w:basedOn w:val=\"Normal\"/>", block)
-                block = re.sub(r"<w:sz\s+[^>]*w:val=\"\d+\"[^>]*/>", "<w:sz w:val=\"22\"/>", block)
-                block = re.sub(r"<w:szCs\s+[^>]*w:val=\"\d+\"[^>]*/>", "<w:szCs w:val=\"22\"/>", block)
-                block = re.sub(
-                    r"<w:rFonts[^>]*/>",
-                    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>',
+                # Ensure author isn't bold (some templates inherit from Title). The <w:b...> rule also
+                # matches <w:basedOn .../>, so a basedOn rewrite to "Normal" would be dropped with it.
+                block = _rewrite_style_tags(
                     block,
+                    {
+                        "sz": "<w:sz w:val=\"22\"/>",
+                        "szcs": "<w:szCs w:val=\"22\"/>",
+                        "rfonts": '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>',
+                        "b": "",
+                    },
                 )
-                # Ensure author isn't bold (some templates inherit from Title).
-                block = re.sub(r"<w:b[^>]*/>", "", block)
                 if "<w:rFonts" not in block:
                     block = block.replace(
                         "<w:rPr>",
@@ -1192,30 +1513,28 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                     block = block.replace("<w:pPr>", '<w:pPr><w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>', 1)
                 return block
 
-            styles = _patch_style(styles, "Author", _author_patch)
+            _patch_style("Author", _author_patch)
 
             # Abstract: 9pt Times, single spaced, no extra before/after.
-            def _abstract_repl(m: re.Match) -> str:
-                block = m.group(0)
-                block = re.sub(r"<w:sz w:val=\"\\d+\"\\s*/>", "<w:sz w:val=\"18\"/>", block)
-                block = re.sub(r"<w:szCs w:val=\"\\d+\"\\s*/>", "<w:szCs w:val=\"18\"/>", block)
-                # spacing to 0
-                block = re.sub(r"<w:spacing[^>]*/>", '<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>', block)
+            def _abstract_patch(block: str) -> str:
+                # sizes, and spacing to 0
+                block = _rewrite_style_tags(
+                    block,
+                    {
+                        "abstract_sz": "<w:sz w:val=\"18\"/>",
+                        "abstract_szcs": "<w:szCs w:val=\"18\"/>",
+                        "spacing": '<w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>',
+                    },
+                )
                 if "<w:rFonts" not in block:
                     block = block.replace("<w:rPr>", '<w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman" w:eastAsia="Times New Roman"/>', 1)
                 return block
 
-            styles = re.sub(
-                r"<w:style[^>]*w:styleId=\"Abstract\"[\s\S]*?</w:style>",
-                _abstract_repl,
-                styles,
-                count=1,
-            )
+            _patch_style("Abstract", _abstract_patch)
 
             # Headings: force Times New Roman and black (remove theme accent color)
-            def _heading_repl(m: re.Match) -> str:
-                block = m.group(0)
-                block = re.sub(r"<w:color[^>]*/>", "", block)
+            def _heading_patch(block: str) -> str:
+                block = _rewrite_style_tags(block, {"color": ""})
                 if "<w:rPr>" in block:
                     block = block.replace(
                         "<w:rPr>",
@@ -1225,26 +1544,22 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                 return block
 
             for hid in ["Heading1", "Heading2", "Heading3", "Heading4", "Heading5", "Heading6"]:
-                styles = re.sub(
-                    rf"<w:style[^>]*w:styleId=\"{hid}\"[\s\S]*?</w:style>",
-                    _heading_repl,
-                    styles,
-                    count=1,
-                )
+                _patch_style(hid, _heading_patch)
 
             # Tighten heading sizes/spacings closer to IEEE Transactions Word template.
             def _heading_size_patch(block: str, size_val: str, italic: bool = False, small_caps: bool = False) -> str:
-                # size (half-points)
-                block = re.sub(r"<w:sz\s+[^>]*w:val=\"\d+\"[^>]*/>", f"<w:sz w:val=\"{size_val}\"/>", block)
-                block = re.sub(r"<w:szCs\s+[^>]*w:val=\"\d+\"[^>]*/>", f"<w:szCs w:val=\"{size_val}\"/>", block)
+                # size (half-points); non-italic headings also drop <w:i...> tags in the same scan
+                # (none of the tags inserted below can match that rule).
+                repl = {"sz": f"<w:sz w:val=\"{size_val}\"/>", "szcs": f"<w:szCs w:val=\"{size_val}\"/>"}
+                if not italic:
+                    repl["i"] = ""
+                block = _rewrite_style_tags(block, repl)
                 # ensure rPr exists
                 if "<w:rPr>" in block and "<w:sz" not in block:
                     block = block.replace("<w:rPr>", f"<w:rPr><w:sz w:val=\"{size_val}\"/><w:szCs w:val=\"{size_val}\"/>", 1)
                 # italic / small caps toggles
                 if italic and "<w:i" not in block:
                     block = block.replace("<w:rPr>", "<w:rPr><w:i/>", 1)
-                if (not italic):
-                    block = re.sub(r"<w:i[^>]*/>", "", block)
                 if small_caps and "<w:smallCaps" not in block:
                     block = block.replace("<w:rPr>", "<w:rPr><w:smallCaps/>", 1)
                 # spacing: modest before, none after
@@ -1252,9 +1567,11 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                     block = block.replace("<w:pPr>", '<w:pPr><w:spacing w:before="120" w:after="0" w:line="240" w:lineRule="auto"/>', 1)
                 return block
 
-            styles = _patch_style(styles, "Heading1", lambda b: _heading_size_patch(b, "20", italic=False, small_caps=True))
-            styles = _patch_style(styles, "Heading2", lambda b: _heading_size_patch(b, "20", italic=True, small_caps=False))
-            styles = _patch_style(styles, "Heading3", lambda b: _heading_size_patch(b, "20", italic=False, small_caps=False))
+            _patch_style("Heading1", lambda b: _heading_size_patch(b, "20", italic=False, small_caps=True))
+            _patch_style("Heading2", lambda b: _heading_size_patch(b, "20", italic=True, small_caps=False))
+            _patch_style("Heading3", lambda b: _heading_size_patch(b, "20", italic=False, small_caps=False))
+
+            styles = "".join(pieces)
 
             # Add a dedicated IndexTerms style if missing; base on BodyText but slightly smaller like Abstract.
             if "w:styleId=\"IndexTerms\"" not in styles:
@@ -1272,73 +1589,44 @@ def postprocess_docx_ieee(docx_path: Path, author_lines: list[str] | None = None
                 )
                 styles = styles.replace("</w:styles>", idx_style + "</w:styles>", 1)
 
-            styles_xml_path.write_text(styles, "utf-8")
+            patched[styles_xml_name] = styles.encode("utf-8")
 
         # Inject a dedicated heading numbering definition (Roman / Letters / Decimal).
-        if numbering_xml_path.exists():
+        if numbering_xml_name in names:
             try:
-                import xml.etree.ElementTree as ET
-
                 ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-                root = ET.parse(numbering_xml_path).getroot()
+                numbering_bytes = src.read(numbering_xml_name)
+                # Cheap pre-check: only the w:num we inject carries numId="2001", so if the raw bytes
+                # already contain it there is nothing to do and the parse/serialize round-trip is skipped.
+                root = None if b'numId="2001"' in numbering_bytes else _parse_docx_part(numbering_bytes)
 
                 # Avoid duplicating if we already injected.
-                if root.find(f".//{{{ns_w}}}num[@{{{ns_w}}}numId='2001']") is None:
-                    abstract_id = "20001"
-                    num_id = "2001"
-
-                    absnum = ET.Element(f"{{{ns_w}}}abstractNum")
-                    absnum.set(f"{{{ns_w}}}abstractNumId", abstract_id)
-                    ET.SubElement(absnum, f"{{{ns_w}}}multiLevelType").set(f"{{{ns_w}}}val", "multilevel")
-
-                    # Level 0: I.
-                    lvl0 = ET.SubElement(absnum, f"{{{ns_w}}}lvl")
-                    lvl0.set(f"{{{ns_w}}}ilvl", "0")
-                    ET.SubElement(lvl0, f"{{{ns_w}}}start").set(f"{{{ns_w}}}val", "1")
-                    ET.SubElement(lvl0, f"{{{ns_w}}}numFmt").set(f"{{{ns_w}}}val", "upperRoman")
-                    ET.SubElement(lvl0, f"{{{ns_w}}}lvlText").set(f"{{{ns_w}}}val", "%1.")
-                    ET.SubElement(lvl0, f"{{{ns_w}}}lvlJc").set(f"{{{ns_w}}}val", "left")
-                    ppr0 = ET.SubElement(lvl0, f"{{{ns_w}}}pPr")
-                    ET.SubElement(ppr0, f"{{{ns_w}}}ind").set(f"{{{ns_w}}}left", "0")
-
-                    # Level 1: A.
-                    lvl1 = ET.SubElement(absnum, f"{{{ns_w}}}lvl")
-                    lvl1.set(f"{{{ns_w}}}ilvl", "1")
-                    ET.SubElement(lvl1, f"{{{ns_w}}}start").set(f"{{{ns_w}}}val", "1")
-                    ET.SubElement(lvl1, f"{{{ns_w}}}numFmt").set(f"{{{ns_w}}}val", "upperLetter")
-                    ET.SubElement(lvl1, f"{{{ns_w}}}lvlText").set(f"{{{ns_w}}}val", "%2.")
-                    ET.SubElement(lvl1, f"{{{ns_w}}}lvlJc").set(f"{{{ns_w}}}val", "left")
-                    ppr1 = ET.SubElement(lvl1, f"{{{ns_w}}}pPr")
-                    ET.SubElement(ppr1, f"{{{ns_w}}}ind").set(f"{{{ns_w}}}left", "0")
-
-                    # Level 2: 1)
-                    lvl2 = ET.SubElement(absnum, f"{{{ns_w}}}lvl")
-                    lvl2.set(f"{{{ns_w}}}ilvl", "2")
-                    ET.SubElement(lvl2, f"{{{ns_w}}}start").set(f"{{{ns_w}}}val", "1")
-                    ET.SubElement(lvl2, f"{{{ns_w}}}numFmt").set(f"{{{ns_w}}}val", "decimal")
-                    ET.SubElement(lvl2, f"{{{ns_w}}}lvlText").set(f"{{{ns_w}}}val", "%3.")
-                    ET.SubElement(lvl2, f"{{{ns_w}}}lvlJc").set(f"{{{ns_w}}}val", "left")
-                    ppr2 = ET.SubElement(lvl2, f"{{{ns_w}}}pPr")
-                    ET.SubElement(ppr2, f"{{{ns_w}}}ind").set(f"{{{ns_w}}}left", "0")
-
-                    root.append(absnum)
-
-                    num = ET.Element(f"{{{ns_w}}}num")
-                    num.set(f"{{{ns_w}}}numId", num_id)
-                    ET.SubElement(num, f"{{{ns_w}}}abstractNumId").set(f"{{{ns_w}}}val", abstract_id)
-                    root.append(num)
-
-                    numbering_xml_path.write_text(ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8"), "utf-8")
+                if root is not None and root.find(f".//{{{ns_w}}}num[@{{{ns_w}}}numId='2001']") is None:
+                    # Parse the prebuilt definition once and graft its children, instead of
+                    # ~40 Element/SubElement/set calls.
+                    for el in list(ET.fromstring(HEADING_NUMBERING_XML)):
+                        root.append(el)
+
+                    patched[numbering_xml_name] = ET.tostring(root, encoding="utf-8", xml_declaration=True)
             except Exception:
                 pass
 
-        # Repack DOCX
-        tmp_out = docx_path.with_suffix(".tmp.docx")
-        with zipfile.ZipFile(tmp_out, "w", compression=zipfile.ZIP_DEFLATED) as z:
-            for fp in td_path.rglob("*"):
-                if fp.is_file():
-                    z.write(fp, fp.relative_to(td_path).as_posix())
-        tmp_out.replace(docx_path)
+        # Repack DOCX: XML parts deflate at level 1 (most of the ratio for a fraction of the CPU);
+        # already-compressed media is stored rather than deflated a second time.
+        with zipfile.ZipFile(tmp_out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+            for info in src.infolist():
+                if info.is_dir():
+                    continue
+                if info.filename in patched:
+                    z.writestr(info.filename, patched[info.filename])
+                    continue
+                target: str | zipfile.ZipInfo = info.filename
+                if os.path.splitext(info.filename)[1].lower() in STORED_MEDIA_EXTS:
+                    target = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    target.compress_type = zipfile.ZIP_STORED
+                with src.open(info) as fin, z.open(target, "w") as fout:
+                    shutil.copyfileobj(fin, fout)
+    tmp_out.replace(docx_path)
 
 
 def main() -> int:
@@ -1378,7 +1666,7 @@ def main() -> int:
     try:
         # Use the pinned submission supplementary TeX as source of truth.
         supp_tex = (docs / "TDSC-2026-01-0318_supplementary.tex").read_text(encoding="utf-8", errors="ignore")
-        m = re.search(r"\\author\{([\s\S]*?)\}", supp_tex)
+        m = AUTHOR_RE.search(supp_tex)
         if m:
             raw = m.group(1)
             parts = [p.strip() for p in raw.split("\\\\") if p.strip()]
@@ -1388,7 +1676,7 @@ def main() -> int:
                 parts = parts[1:]
             # Normalize common prefixes
             for p in parts:
-                p = re.sub(r"\s+", " ", p).strip()
+                p = " ".join(p.split())
                 author_lines.append(p)
     except Exception:
         author_lines = []
@@ -1399,50 +1687,89 @@ def main() -> int:
 
     # 0) Remove PDF text-extraction helpers that pandoc doesn't load.
     # They matter for PDF, not for DOCX, and can cause include-file warnings.
-    src = re.sub(r"^\\input\{glyphtounicode\}\s*$", "", src, flags=re.MULTILINE)
-    src = re.sub(r"^\\pdfgentounicode=1\s*$", "", src, flags=re.MULTILINE)
-
     # 0b) Strip IEEEtran wrappers that rely on brace-scoped arguments.
     # Pandoc's LaTeX reader is easily derailed by these wrappers even if LaTeX itself can handle them.
     # We keep the abstract/keywords contents but remove the wrapper macro call.
-    src = src.replace("\\IEEEtitleabstractindextext{%", "")
-    src = src.replace("\\IEEEtitleabstractindextext{", "")
+    # Both are plain deletions, so a single scan of src handles them; it is skipped when
+    # neither marker occurs (substring checks are far cheaper than the MULTILINE scan).
+    if "tounicode" in src or "IEEEtitleabstractindextext" in src:
+        src = WORD_PREAMBLE_NOISE_RE.sub("", src)
 
     # 0c) Rasterize all figure PDFs with pdftocairo into a dedicated folder for DOCX embedding.
     # This makes Word figures visually closer to the final PDF rendering (consistent rasterizer).
+    # A PNG is reused when it is newer than its PDF and its "<name>.png.dpi" sidecar matches
+    # --figure-dpi; the remaining pdftocairo calls are independent subprocesses, so run them
+    # concurrently when there is more than one.
     docx_fig_dir.mkdir(parents=True, exist_ok=True)
+    figure_dpi = str(args.figure_dpi)
+
+    def _rasterize_figure(job: tuple[Path, Path]) -> None:
+        pdf, png = job
+        dpi_path = png.with_name(png.name + ".dpi")
+        dpi_path.unlink(missing_ok=True)
+        rasterize_pdf_to_png(pdf, png, args.figure_dpi)
+        dpi_path.write_text(figure_dpi, encoding="utf-8")
+
+    stale: list[tuple[Path, Path]] = []
     for pdf in sorted(figures_dir.glob("*.pdf")):
-        rasterize_pdf_to_png(pdf, docx_fig_dir / (pdf.stem + ".png"), args.figure_dpi)
+        png = docx_fig_dir / (pdf.stem + ".png")
+        try:
+            if (
+                png.stat().st_mtime >= pdf.stat().st_mtime
+                and png.with_name(png.name + ".dpi").read_text(encoding="utf-8") == figure_dpi
+            ):
+                continue
+        except FileNotFoundError:
+            pass
+        stale.append((pdf, png))
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as pool:
+            list(pool.map(_rasterize_figure, stale))
+    else:
+        for job in stale:
+            _rasterize_figure(job)
 
     # TikZ-only figures: generate standalone PDFs and rasterize them as well (best-effort).
     # If extraction/build fails, fall back to existing PNGs.
-    arch_pdf = docx_fig_dir / "fig_architecture.pdf"
-    if build_standalone_tikz_pdf(docs, src, "fig:architecture", arch_pdf):
-        rasterize_pdf_to_png(arch_pdf, docx_fig_dir / "fig_architecture.png", args.figure_dpi)
-    elif (figures_dir / "fig_architecture.png").exists():
+    # The builds are independent (distinct latexmk jobnames) and dominated by latexmk/pdftocairo
+    # subprocess time, so run them concurrently.
+    def _build_tikz_png(label: str, stem: str) -> bool:
+        pdf = docx_fig_dir / f"{stem}.pdf"
+        if not build_standalone_tikz_pdf(docs, src, label, pdf):
+            return False
+        rasterize_pdf_to_png(pdf, docx_fig_dir / f"{stem}.png", args.figure_dpi)
+        return True
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        arch_job = pool.submit(_build_tikz_png, "fig:architecture", "fig_architecture")
+        sm_job = pool.submit(_build_tikz_png, "fig:state-machines", "fig_state_machines")
+        arch_ok = arch_job.result()
+        sm_ok = sm_job.result()
+
+    if not arch_ok and (figures_dir / "fig_architecture.png").exists():
         shutil.copy2(figures_dir / "fig_architecture.png", docx_fig_dir / "fig_architecture.png")
 
-    sm_pdf = docx_fig_dir / "fig_state_machines.pdf"
-    if build_standalone_tikz_pdf(docs, src, "fig:state-machines", sm_pdf):
-        rasterize_pdf_to_png(sm_pdf, docx_fig_dir / "fig_state_machines.png", args.figure_dpi)
-    elif (figures_dir / "fig_state_machines_tikz.png").exists():
-        shutil.copy2(figures_dir / "fig_state_machines_tikz.png", docx_fig_dir / "fig_state_machines.png")
-    elif (figures_dir / "fig_state_machines.png").exists():
-        shutil.copy2(figures_dir / "fig_state_machines.png", docx_fig_dir / "fig_state_machines.png")
+    if not sm_ok:
+        if (figures_dir / "fig_state_machines_tikz.png").exists():
+            shutil.copy2(figures_dir / "fig_state_machines_tikz.png", docx_fig_dir / "fig_state_machines.png")
+        elif (figures_dir / "fig_state_machines.png").exists():
+            shutil.copy2(figures_dir / "fig_state_machines.png", docx_fig_dir / "fig_state_machines.png")
 
     # 1) Swap PDF figures for PNG where available (DOCX embedding)
     # Prefer pdftocairo raster outputs in _docx_figs/ when possible.
+    # One directory listing instead of a stat() per figure reference.
+    png_names = {p.name for p in docx_fig_dir.glob("*.png")}
+
     def _swap_fig_pdf(m: re.Match) -> str:
         path = m.group(1)
         if path.endswith(".pdf"):
-            stem = Path(path).with_suffix("").name
-            candidate = docx_fig_dir / f"{stem}.png"
-            if candidate.exists():
-                return "{_docx_figs/" + candidate.name + "}"
+            name = Path(path).with_suffix("").name + ".png"
+            if name in png_names:
+                return "{_docx_figs/" + name + "}"
         # fallback: keep original path (pandoc may still resolve pngs next to it)
         return "{" + path + "}"
 
-    src = re.sub(r"\{(figures/[^}]+)\}", _swap_fig_pdf, src)
+    src = FIG_PATH_RE.sub(_swap_fig_pdf, src)
 
     # 2) Replace TikZ figures with pre-rendered PNGs
     # Architecture figure (tikz) -> fig_architecture.png
@@ -1465,21 +1792,13 @@ def main() -> int:
     src = strip_latex_softbreaks(src)
     src = normalize_texttt_code_strings(src)
     src = unwrap_pandocbounded(src)
-    src = replace_refs(src, ref_map)
-    src = replace_cites(src, cite_map)
+    src = resolve_refs_cites(src, ref_map, cite_map)
 
     # 3b) Rewrite bibliography to IEEE Word-friendly REFERENCES section with [n] items.
     src = rewrite_bibliography_for_word(src, cite_map)
 
-    # 4) Reduce IEEEtran-only wrappers that confuse conversion
-    src = src.replace("\\IEEEdisplaynontitleabstractindextext", "")
-    # Exact wrapper used in this paper:
-    src = src.replace(
-        "\\IEEEraisesectionheading{\\section{Introduction}\\label{sec:introduction}}",
-        "\\section{Introduction}\\label{sec:introduction}",
-    )
-    # IEEEtran sometimes leaves an extra closing brace after IEEEkeywords in Pandoc-generated LaTeX.
-    src = src.replace("\\end{IEEEkeywords}}", "\\end{IEEEkeywords}")
+    # 4) Reduce IEEEtran-only wrappers that confuse conversion (one scan, see IEEE_WRAPPER_FIXUPS).
+    src = IEEE_WRAPPER_FIXUP_RE.sub(_ieee_wrapper_fixup_repl, src)
 
     # Derived LaTeX input for docx conversion
     derived_tex = docs / "_docx_export.tex"
@@ -1489,7 +1808,8 @@ def main() -> int:
     if args.backup_existing and out_docx.exists():
         ts = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
         backup = out_docx.with_name(out_docx.stem + f"_BACKUP_{ts}" + out_docx.suffix)
-        shutil.copy2(out_docx, backup)
+        # An output identical to the last timestamped backup is not copied again.
+        backup_if_changed(out_docx, backup)
 
     # Create a default reference docx if not present (improves Word styling vs random defaults)
     ref_docx = docs / "_pandoc_reference.docx"
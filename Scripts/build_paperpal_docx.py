@@ -15,16 +15,89 @@ It optimizes for readable, structurally clean DOCX while remaining close to IEEE
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import zipfile
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import xml.etree.ElementTree as ET
+
+# Prefer lxml for the DOCX XML round-trip (compiled parser/serializer); the stdlib
+# ElementTree exposes the same Element/SubElement/find/tostring API used below.
+try:
+    from lxml import etree as ET
+
+    _HAVE_LXML = True
+except ImportError:  # pragma: no cover - optional dependency
+    import xml.etree.ElementTree as ET
+
+    _HAVE_LXML = False
+
+
+FIGURE_BEGIN_RE = re.compile(r"\\begin\{(figure\*?)\}")
+TIKZ_PICTURE_RE = re.compile(r"(\\begin\{tikzpicture\}.*?\\end\{tikzpicture\})", re.S)
+FIGURE_BODY_BEFORE_CAPTION_RE = re.compile(r"\\centering\s*(.*?)\\caption\s*\{", re.S)
+ARCH_CAPTION_RE = re.compile(r"(\\caption\{.*?\}\s*\\label\{fig:architecture\})", re.S)
+SM_CAPTION_RE = re.compile(r"(\\caption\{.*?\}\s*\\label\{fig:state-machines\})", re.S)
+REF_KEY_RE = re.compile(r"ref(\d+)")
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# Section 1 (title/abstract) properties for the continuous break before Introduction: the same
+# Letter page and margins _patch_docx_ieeeish sets on the final section, but one column.
+SECTION1_SECTPR_XML = (
+    f'<w:sectPr xmlns:w="{W_NS}">'
+    '<w:type w:val="continuous"/>'
+    '<w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1080" w:bottom="1080" w:left="1080" w:right="1080"'
+    ' w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:num="1"/>'
+    "</w:sectPr>"
+)
+# Already-compressed media: stored as-is in the repacked DOCX instead of deflated again.
+STORED_MEDIA_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".pdf", ".mp4"})
+if _HAVE_LXML:
+    # Compiled once at import; yields the w:t strings directly instead of walking elements.
+    P_TEXT_XPATH = ET.XPath(".//w:t/text()", namespaces={"w": W_NS}, smart_strings=False)
+
+# Literal rewrites for _preprocess_tex_for_pandoc. Order matters: the doubled-brace
+# "\end{IEEEkeywords}}" must be tried before "\end{IEEEkeywords}".
+PANDOC_PREP_LITERALS = {
+    r"\IEEEtitleabstractindextext{%": "",
+    r"\end{IEEEkeywords}}": "\n",
+    r"\begin{abstract}": r"\noindent\textbf{Abstract—} ",
+    r"\end{abstract}": "\n",
+    r"\begin{IEEEkeywords}": r"\noindent\textbf{Index Terms—} ",
+    r"\end{IEEEkeywords}": "\n",
+}
+PANDOC_PREP_LINES = {
+    "glyph": r"% \input{glyphtounicode} (disabled for docx)",
+    "pdfgen": r"% \pdfgentounicode (disabled for docx)",
+    "displaynontitle": "",
+}
+# The source-level rewrites that precede the TikZ figure swap, as one alternation;
+# _pandoc_prep_repl dispatches on the matching group.
+PANDOC_PREP_RE = re.compile(
+    r"(?P<glyph>^\s*\\input\{glyphtounicode\}\s*$)"
+    r"|(?P<pdfgen>^\s*\\pdfgentounicode=.*$)"
+    r"|(?P<displaynontitle>^\s*\\IEEEdisplaynontitleabstractindextext\s*$)"
+    r"|\\IEEEraisesectionheading\{\\section\{Introduction\}\\label\{(?P<intro_label>[^}]+)\}\}"
+    r"|(?P<fig_pdf>figures/fig_[^}]+)\.pdf(?=\})"
+    r"|(?P<literal>" + "|".join(map(re.escape, PANDOC_PREP_LITERALS)) + ")",
+    re.M,
+)
+# Citation and bibliography rewrites. These run after the figure swap: the caption regexes
+# above rely on the original \cite{...} braces between \caption and \label.
+CITE_BIB_RE = re.compile(
+    r"\\cite\{(?P<cite>[^}]+)\}"
+    r"|\\bibitem\{ref(?P<bibitem>\d+)\}\s*"
+    r"|(?P<bib_begin>\\begin\{thebibliography\}\{[^}]*\})"
+    r"|(?P<bib_end>\\end\{thebibliography\})"
+)
 
 
 def _run(cmd: list[str], *, cwd: Optional[Path] = None) -> None:
@@ -50,23 +123,32 @@ def _write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
-def _extract_figure_block(tex: str, *, label: str) -> str:
+def _backup_if_changed(path: Path, backup: Path) -> None:
+    # The digest of the last backed-up content sits next to the backup; skip the copy when unchanged.
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    digest_path = backup.with_name(backup.name + ".blake2b")
+    if backup.exists() and digest_path.exists() and digest_path.read_text(encoding="utf-8") == digest:
+        return
+    shutil.copy2(path, backup)
+    _write_text(digest_path, digest)
+
+
+def _figure_block_span(tex: str, *, label: str) -> tuple[int, int]:
     label_token = f"\\label{{{label}}}"
     label_idx = tex.find(label_token)
     if label_idx < 0:
         raise RuntimeError(f"Could not find label token: {label_token}")
 
-    # Find the nearest preceding \begin{figure} / \begin{figure*}.
-    begin_iter = list(re.finditer(r"\\begin\{figure\*?\}", tex[:label_idx]))
-    if not begin_iter:
-        raise RuntimeError(f"Could not find figure begin for label {label}")
-
-    begin_match = begin_iter[-1]
-    begin_token = begin_match.group(0)
-    env_match = re.search(r"\\begin\{(figure\*?)\}", begin_token)
-    if not env_match:
-        raise RuntimeError(f"Could not parse figure env from token: {begin_token}")
-    env = env_match.group(1)
+    # Find the nearest preceding \begin{figure} / \begin{figure*}: search backwards from the
+    # label and confirm each candidate with the regex, instead of scanning the whole prefix.
+    begin_match = None
+    pos = label_idx
+    while begin_match is None:
+        pos = tex.rfind("\\begin{figure", 0, pos)
+        if pos < 0:
+            raise RuntimeError(f"Could not find figure begin for label {label}")
+        begin_match = FIGURE_BEGIN_RE.match(tex, pos, label_idx)
+    env = begin_match.group(1)
 
     end_token = f"\\end{{{env}}}"
     end_idx = tex.find(end_token, label_idx)
@@ -74,17 +156,22 @@ def _extract_figure_block(tex: str, *, label: str) -> str:
         raise RuntimeError(f"Could not find matching {end_token} for label {label}")
 
     end_idx_end = end_idx + len(end_token)
-    return tex[begin_match.start() : end_idx_end]
+    return begin_match.start(), end_idx_end
+
+
+def _extract_figure_block(tex: str, *, label: str) -> str:
+    start, end = _figure_block_span(tex, label=label)
+    return tex[start:end]
 
 
 def _extract_tikz_picture(block: str) -> str:
-    m = re.search(r"(\\begin\{tikzpicture\}.*?\\end\{tikzpicture\})", block, flags=re.S)
+    m = TIKZ_PICTURE_RE.search(block)
     if not m:
         raise RuntimeError("Could not find tikzpicture in figure block")
     return m.group(1)
 
 def _extract_all_tikz_pictures(block: str) -> list[str]:
-    pics = re.findall(r"(\\begin\{tikzpicture\}.*?\\end\{tikzpicture\})", block, flags=re.S)
+    pics = TIKZ_PICTURE_RE.findall(block)
     if not pics:
         raise RuntimeError("Could not find tikzpicture blocks in figure block")
     return pics
@@ -92,7 +179,7 @@ def _extract_all_tikz_pictures(block: str) -> list[str]:
 
 def _extract_figure_body_before_caption(block: str) -> str:
     # Extract everything after \centering up to (but excluding) \caption{...}
-    m = re.search(r"\\centering\s*(.*?)\\caption\s*\{", block, flags=re.S)
+    m = FIGURE_BODY_BEFORE_CAPTION_RE.search(block)
     if not m:
         raise RuntimeError("Could not locate figure body before caption")
     return m.group(1).strip()
@@ -105,11 +192,9 @@ def _render_tikz_to_png(
     build_dir: Path,
     document_preamble: str,
 ) -> None:
-    tex_name = out_png.with_suffix("").name + ".tex"
-    pdf_name = out_png.with_suffix("").name + ".pdf"
-
-    tex_path = build_dir / tex_name
-    pdf_path = build_dir / pdf_name
+    stem = out_png.with_suffix("").name
+    tex_path = build_dir / f"{stem}.tex"
+    pdf_path = build_dir / f"{stem}.pdf"
 
     tex_doc = "\n".join(
         [
@@ -125,12 +210,29 @@ def _render_tikz_to_png(
         ]
     )
 
-    _write_text(tex_path, tex_doc)
-
-    pdflatex = _which_or_die("pdflatex", hint="Install MacTeX (pdflatex)")
     pdftocairo = _which_or_die("pdftocairo", hint="Install poppler (pdftocairo)")
 
-    _run([pdflatex, "-interaction=nonstopmode", "-halt-on-error", tex_path.name], cwd=build_dir)
+    # The compiled PDF is cached under a digest of the standalone source, so an unchanged
+    # picture skips pdflatex entirely (same idea as TikZ's external library).
+    digest = hashlib.sha256(tex_doc.encode("utf-8")).hexdigest()
+    cached_pdf = build_dir / f"{stem}.{digest}.pdf"
+    if not cached_pdf.exists():
+        _write_text(tex_path, tex_doc)
+        pdflatex = _which_or_die("pdflatex", hint="Install MacTeX (pdflatex)")
+        _run([pdflatex, "-interaction=nonstopmode", "-halt-on-error", tex_path.name], cwd=build_dir)
+        os.replace(pdf_path, cached_pdf)
+        # Drop PDFs (and PNG digests) cached for earlier versions of this picture.
+        for pattern in ("pdf", "png.sha256"):
+            for stale in build_dir.glob(f"{stem}.{'?' * len(digest)}.{pattern}"):
+                if stale.name != f"{stem}.{digest}.{pattern}":
+                    stale.unlink(missing_ok=True)
+
+    # pdftocairo output is deterministic for a given PDF, so keep it when the PNG on disk is
+    # still the one rendered from this digest (sidecar holds its sha256).
+    png_digest_path = build_dir / f"{stem}.{digest}.png.sha256"
+    if out_png.exists() and png_digest_path.exists():
+        if png_digest_path.read_text(encoding="utf-8") == hashlib.sha256(out_png.read_bytes()).hexdigest():
+            return
 
     out_base = out_png.with_suffix("")
     _run(
@@ -140,7 +242,7 @@ def _render_tikz_to_png(
             "-r",
             "300",
             "-singlefile",
-            pdf_path.name,
+            cached_pdf.name,
             str(out_base),
         ],
         cwd=build_dir,
@@ -148,6 +250,43 @@ def _render_tikz_to_png(
 
     if not out_png.exists():
         raise RuntimeError(f"Expected PNG not found: {out_png}")
+    _write_text(png_digest_path, hashlib.sha256(out_png.read_bytes()).hexdigest())
+
+
+def _format_cites(raw: str) -> str:
+    keys = [k.strip() for k in raw.split(",") if k.strip()]
+    nums: list[str] = []
+    for k in keys:
+        m = REF_KEY_RE.fullmatch(k)
+        if not m:
+            nums.append(k)
+        else:
+            nums.append(m.group(1))
+    if all(n.isdigit() for n in nums):
+        return ", ".join(f"[{n}]" for n in nums)
+    return f"[{', '.join(nums)}]"
+
+
+def _pandoc_prep_repl(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    if kind == "literal":
+        return PANDOC_PREP_LITERALS[m.group(0)]
+    if kind == "fig_pdf":
+        return m.group("fig_pdf") + ".png"
+    if kind == "intro_label":
+        return "\\section{Introduction}\\label{" + m.group("intro_label") + "}"
+    return PANDOC_PREP_LINES[kind]
+
+
+def _cite_bib_repl(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    if kind == "cite":
+        return _format_cites(m.group("cite"))
+    if kind == "bibitem":
+        return "\n\\par\\noindent [" + m.group("bibitem") + "] "
+    if kind == "bib_begin":
+        return "\\section*{REFERENCES}"
+    return ""
 
 
 def _preprocess_tex_for_pandoc(
@@ -157,34 +296,19 @@ def _preprocess_tex_for_pandoc(
     state_machine_initiator_png_rel: str,
     state_machine_responder_png_rel: str,
 ) -> str:
+    # One pass over the source (PANDOC_PREP_RE):
     # 1) Drop PDF unicode helpers (pandoc can't include local tex includes reliably).
-    tex = re.sub(r"^\s*\\input\{glyphtounicode\}\s*$", r"% \\input{glyphtounicode} (disabled for docx)", tex, flags=re.M)
-    tex = re.sub(r"^\s*\\pdfgentounicode=.*$", r"% \\pdfgentounicode (disabled for docx)", tex, flags=re.M)
-
     # 2) Unwrap IEEE's abstract/keywords wrapper (pandoc ignores unknown macro arguments).
-    tex = tex.replace(r"\IEEEtitleabstractindextext{%", "")
-    tex = tex.replace(r"\end{IEEEkeywords}}", r"\end{IEEEkeywords}")
-    tex = re.sub(r"^\s*\\IEEEdisplaynontitleabstractindextext\s*$", "", tex, flags=re.M)
-
     # 3) Convert IEEEkeywords to a simple paragraph marker for Word.
-    tex = tex.replace(r"\begin{abstract}", r"\noindent\textbf{Abstract—} ")
-    tex = tex.replace(r"\end{abstract}", "\n")
-    tex = tex.replace(r"\begin{IEEEkeywords}", r"\noindent\textbf{Index Terms—} ")
-    tex = tex.replace(r"\end{IEEEkeywords}", "\n")
-
     # 4) Make Introduction visible as a normal section to pandoc.
-    tex = re.sub(
-        r"\\IEEEraisesectionheading\{\\section\{Introduction\}\\label\{([^}]+)\}\}",
-        r"\\section{Introduction}\\label{\1}",
-        tex,
-    )
-
     # 5) Switch embedded PDF figures to PNG for pandoc (PDF figures are often dropped).
-    tex = re.sub(r"(figures/fig_[^}]+)\.pdf(\})", r"\1.png\2", tex)
+    tex = PANDOC_PREP_RE.sub(_pandoc_prep_repl, tex)
 
     # 6) Replace TikZ-only figures with rendered PNGs (keeps original diagram shapes).
-    arch_block = _extract_figure_block(tex, label="fig:architecture")
-    arch_cap = re.search(r"(\\caption\{.*?\}\s*\\label\{fig:architecture\})", arch_block, flags=re.S)
+    # Both figure spans are located up front and spliced in one join, rather than two
+    # tex.replace() calls that each search the whole source for a multi-KB block.
+    arch_start, arch_end = _figure_block_span(tex, label="fig:architecture")
+    arch_cap = ARCH_CAPTION_RE.search(tex, arch_start, arch_end)
     if not arch_cap:
         raise RuntimeError("Could not extract architecture caption/label")
     arch_repl = "\n".join(
@@ -196,10 +320,9 @@ def _preprocess_tex_for_pandoc(
             r"\end{figure*}",
         ]
     )
-    tex = tex.replace(arch_block, arch_repl)
 
-    sm_block = _extract_figure_block(tex, label="fig:state-machines")
-    sm_cap = re.search(r"(\\caption\{.*?\}\s*\\label\{fig:state-machines\})", sm_block, flags=re.S)
+    sm_start, sm_end = _figure_block_span(tex, label="fig:state-machines")
+    sm_cap = SM_CAPTION_RE.search(tex, sm_start, sm_end)
     if not sm_cap:
         raise RuntimeError("Could not extract state-machines caption/label")
     sm_repl = "\n".join(
@@ -213,35 +336,33 @@ def _preprocess_tex_for_pandoc(
             r"\end{figure}",
         ]
     )
-    tex = tex.replace(sm_block, sm_repl)
 
-    # 7) Normalize citations to numeric bracket form so pandoc doesn't drop them.
-    def _cite_repl(match: re.Match[str]) -> str:
-        raw = match.group(1)
-        keys = [k.strip() for k in raw.split(",") if k.strip()]
-        nums: list[str] = []
-        for k in keys:
-            m = re.fullmatch(r"ref(\d+)", k)
-            if not m:
-                nums.append(k)
-            else:
-                nums.append(m.group(1))
-        if all(n.isdigit() for n in nums):
-            return ", ".join(f"[{n}]" for n in nums)
-        return f"[{', '.join(nums)}]"
-
-    tex = re.sub(r"\\cite\{([^}]+)\}", _cite_repl, tex)
+    chunks: list[str] = []
+    pos = 0
+    for start, end, repl in sorted([(arch_start, arch_end, arch_repl), (sm_start, sm_end, sm_repl)]):
+        chunks += [tex[pos:start], repl]
+        pos = end
+    chunks.append(tex[pos:])
+    tex = "".join(chunks)
 
+    # One more pass (CITE_BIB_RE):
+    # 7) Normalize citations to numeric bracket form so pandoc doesn't drop them.
     # 8) Turn thebibliography into plain paragraphs with explicit labels.
-    tex = re.sub(r"\\begin\{thebibliography\}\{[^}]*\}", r"\\section*{REFERENCES}", tex)
-    tex = re.sub(r"\\end\{thebibliography\}", "", tex)
-    tex = re.sub(r"\\bibitem\{ref(\d+)\}\s*", r"\n\\par\\noindent [\1] ", tex)
+    tex = CITE_BIB_RE.sub(_cite_bib_repl, tex)
 
     return tex
 
 
+def _ensure_child(parent: ET.Element, tag: str) -> ET.Element:
+    # First direct child with this Clark tag, created (appended) if missing. A plain scan of the
+    # few children avoids the path parsing of find("w:x", ns).
+    for child in parent:
+        if child.tag == tag:
+            return child
+    return ET.SubElement(parent, tag)
+
+
 def _patch_docx_ieeeish(docx_path: Path) -> None:
-    W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
     ns = {"w": W_NS}
 
     def qn(tag: str) -> str:
@@ -255,43 +376,52 @@ def _patch_docx_ieeeish(docx_path: Path) -> None:
     ET.register_namespace("pic", "http://schemas.openxmlformats.org/drawingml/2006/picture")
     ET.register_namespace("m", "http://schemas.openxmlformats.org/officeDocument/2006/math")
 
+    # Only the two XML parts we patch are loaded; media etc. are streamed on repack.
     with zipfile.ZipFile(docx_path, "r") as z:
-        files = {name: z.read(name) for name in z.namelist()}
-
-    if "word/document.xml" not in files or "word/styles.xml" not in files:
-        raise RuntimeError("DOCX missing expected parts (word/document.xml, word/styles.xml)")
-
-    doc_root = ET.fromstring(files["word/document.xml"])
+        names = set(z.namelist())
+        if "word/document.xml" not in names or "word/styles.xml" not in names:
+            raise RuntimeError("DOCX missing expected parts (word/document.xml, word/styles.xml)")
+        doc_xml = z.read("word/document.xml")
+        styles_xml = z.read("word/styles.xml")
+
+    if _HAVE_LXML:
+        # huge_tree lifts libxml2's limits (text node size, depth) that a large document.xml can trip.
+        parser = ET.XMLParser(huge_tree=True)
+        doc_root = ET.fromstring(doc_xml, parser)
+    else:
+        doc_root = ET.fromstring(doc_xml)
     body = doc_root.find("w:body", ns)
     if body is None:
         raise RuntimeError("Invalid DOCX: missing w:body")
 
     # --- Section/layout: 2 columns from Introduction onward ---
-    paragraphs = body.findall("w:p", ns)
-
-    def para_text(p: ET.Element) -> str:
-        return "".join((t.text or "") for t in p.findall(".//w:t", ns)).strip()
-
-    intro_idx: Optional[int] = None
-    for i, p in enumerate(paragraphs):
-        if para_text(p).lower() == "introduction":
-            intro_idx = i
+    def is_intro(p: ET.Element) -> bool:
+        # Collect run text only until it is provably longer than "introduction".
+        texts = P_TEXT_XPATH(p) if _HAVE_LXML else ((t.text or "") for t in p.iter(qn("t")))
+        text = ""
+        for t in texts:
+            text += t
+            if len(text.strip()) > len("introduction"):
+                return False
+        return text.strip().lower() == "introduction"
+
+    # Stream the body paragraphs and stop at Introduction; only its predecessor is needed.
+    intro_prev: Optional[ET.Element] = None
+    prev_p: Optional[ET.Element] = None
+    for p in body.iterfind("w:p", ns):
+        if is_intro(p):
+            intro_prev = prev_p
             break
+        prev_p = p
 
-    end_sectpr = body.find("w:sectPr", ns)
-    if end_sectpr is None:
-        end_sectpr = ET.SubElement(body, qn("sectPr"))
+    end_sectpr = _ensure_child(body, qn("sectPr"))
 
     # Set page to Letter and reasonable margins.
-    pgSz = end_sectpr.find("w:pgSz", ns)
-    if pgSz is None:
-        pgSz = ET.SubElement(end_sectpr, qn("pgSz"))
+    pgSz = _ensure_child(end_sectpr, qn("pgSz"))
     pgSz.set(qn("w"), "12240")   # 8.5in * 1440
     pgSz.set(qn("h"), "15840")   # 11in * 1440
 
-    pgMar = end_sectpr.find("w:pgMar", ns)
-    if pgMar is None:
-        pgMar = ET.SubElement(end_sectpr, qn("pgMar"))
+    pgMar = _ensure_child(end_sectpr, qn("pgMar"))
     # 0.75in margins (approx IEEE look) => 1080 twips.
     for k in ("top", "bottom", "left", "right"):
         pgMar.set(qn(k), "1080")
@@ -299,48 +429,32 @@ def _patch_docx_ieeeish(docx_path: Path) -> None:
     pgMar.set(qn("footer"), "720")
     pgMar.set(qn("gutter"), "0")
 
-    cols = end_sectpr.find("w:cols", ns)
-    if cols is None:
-        cols = ET.SubElement(end_sectpr, qn("cols"))
+    cols = _ensure_child(end_sectpr, qn("cols"))
     cols.set(qn("num"), "2")
     cols.set(qn("space"), "360")  # 0.25in column gap
 
-    if intro_idx is not None and intro_idx > 0:
+    if intro_prev is not None:
         # Insert a "continuous" section break BEFORE Introduction:
         # - Section 1 (title/abstract): single-column
         # - Section 2 (body): uses end_sectpr (2 columns)
-        prev = paragraphs[intro_idx - 1]
-        pPr = prev.find("w:pPr", ns)
-        if pPr is None:
-            pPr = ET.SubElement(prev, qn("pPr"))
+        prev = intro_prev
+        pPr = _ensure_child(prev, qn("pPr"))
 
         # Avoid adding multiple section breaks if script re-runs.
         existing = pPr.find("w:sectPr", ns)
         if existing is None:
-            s1 = ET.SubElement(pPr, qn("sectPr"))
-            t = ET.SubElement(s1, qn("type"))
-            t.set(qn("val"), "continuous")
-
-            # Copy page settings from end section for consistency (but keep 1 col).
-            for child_tag in ("pgSz", "pgMar"):
-                src = end_sectpr.find(f"w:{child_tag}", ns)
-                if src is not None:
-                    s1.append(deepcopy(src))
-            c1 = ET.SubElement(s1, qn("cols"))
-            c1.set(qn("num"), "1")
+            # Page settings match the end section set above (but keep 1 col); parsed from a
+            # prebuilt fragment instead of deep-copying pgSz/pgMar.
+            pPr.append(ET.fromstring(SECTION1_SECTPR_XML))
 
     # --- Styles: Times New Roman 10pt for Normal ---
-    styles_root = ET.fromstring(files["word/styles.xml"])
+    styles_root = ET.fromstring(styles_xml, parser) if _HAVE_LXML else ET.fromstring(styles_xml)
     body_style_ids = {"Normal", "BodyText", "FirstParagraph", "Compact", "BlockText"}
     font_only_style_ids = {"Title", "Author", "Heading1", "Heading2", "ImageCaption", "TableCaption", "CaptionedFigure"}
 
     def ensure_fonts(style: ET.Element) -> ET.Element:
-        rPr = style.find("w:rPr", ns)
-        if rPr is None:
-            rPr = ET.SubElement(style, qn("rPr"))
-        rFonts = rPr.find("w:rFonts", ns)
-        if rFonts is None:
-            rFonts = ET.SubElement(rPr, qn("rFonts"))
+        rPr = _ensure_child(style, qn("rPr"))
+        rFonts = _ensure_child(rPr, qn("rFonts"))
         for attr in ("ascii", "hAnsi", "cs", "eastAsia"):
             rFonts.set(qn(attr), "Times New Roman")
         return rPr
@@ -348,28 +462,18 @@ def _patch_docx_ieeeish(docx_path: Path) -> None:
     def set_body_defaults(style: ET.Element) -> None:
         rPr = ensure_fonts(style)
 
-        sz = rPr.find("w:sz", ns)
-        if sz is None:
-            sz = ET.SubElement(rPr, qn("sz"))
+        sz = _ensure_child(rPr, qn("sz"))
         sz.set(qn("val"), "20")  # 10pt in half-points
 
-        szCs = rPr.find("w:szCs", ns)
-        if szCs is None:
-            szCs = ET.SubElement(rPr, qn("szCs"))
+        szCs = _ensure_child(rPr, qn("szCs"))
         szCs.set(qn("val"), "20")
 
-        pPr = style.find("w:pPr", ns)
-        if pPr is None:
-            pPr = ET.SubElement(style, qn("pPr"))
+        pPr = _ensure_child(style, qn("pPr"))
 
-        jc = pPr.find("w:jc", ns)
-        if jc is None:
-            jc = ET.SubElement(pPr, qn("jc"))
+        jc = _ensure_child(pPr, qn("jc"))
         jc.set(qn("val"), "both")  # justify
 
-        spacing = pPr.find("w:spacing", ns)
-        if spacing is None:
-            spacing = ET.SubElement(pPr, qn("spacing"))
+        spacing = _ensure_child(pPr, qn("spacing"))
         spacing.set(qn("before"), "0")
         spacing.set(qn("after"), "0")
 
@@ -382,19 +486,34 @@ def _patch_docx_ieeeish(docx_path: Path) -> None:
         elif style_id in font_only_style_ids:
             ensure_fonts(st)
 
-    # Write a new docx atomically.
+    # lxml keeps the standalone="yes" declaration Word writes; stdlib has no such option.
+    xml_opts = {"encoding": "utf-8", "xml_declaration": True}
+    if _HAVE_LXML:
+        xml_opts["standalone"] = True
+
+    # Write a new docx atomically. XML parts deflate at level 1 (most of the ratio for a fraction
+    # of the CPU); media is stored.
     with tempfile.TemporaryDirectory() as td:
         tmp = Path(td) / docx_path.name
-        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as z:
-            for name, content in files.items():
+        with zipfile.ZipFile(docx_path, "r") as src, zipfile.ZipFile(
+            tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as z:
+            for info in src.infolist():
+                name = info.filename
                 if name == "word/document.xml":
-                    out = ET.tostring(doc_root, encoding="utf-8", xml_declaration=True)
+                    out = ET.tostring(doc_root, **xml_opts)
                     z.writestr(name, out)
                 elif name == "word/styles.xml":
-                    out = ET.tostring(styles_root, encoding="utf-8", xml_declaration=True)
+                    out = ET.tostring(styles_root, **xml_opts)
                     z.writestr(name, out)
                 else:
-                    z.writestr(name, content)
+                    target: str | zipfile.ZipInfo = name
+                    if os.path.splitext(name)[1].lower() in STORED_MEDIA_EXTS:
+                        target = zipfile.ZipInfo(name, date_time=info.date_time)
+                        target.compress_type = zipfile.ZIP_STORED
+                    # Copy one member at a time instead of holding the whole package in memory.
+                    with src.open(info) as fin, z.open(target, "w") as fout:
+                        shutil.copyfileobj(fin, fout)
         shutil.move(str(tmp), str(docx_path))
 
 
@@ -441,9 +560,28 @@ def main() -> int:
     sm_init_png = figures_dir / "fig_state_machine_initiator_tikz.png"
     sm_resp_png = figures_dir / "fig_state_machine_responder_tikz.png"
 
-    _render_tikz_to_png(tikz_body=arch_tikz, out_png=arch_png, build_dir=build_dir, document_preamble=preamble)
-    _render_tikz_to_png(tikz_body=sm_pics[0], out_png=sm_init_png, build_dir=build_dir, document_preamble=preamble)
-    _render_tikz_to_png(tikz_body=sm_pics[1], out_png=sm_resp_png, build_dir=build_dir, document_preamble=preamble)
+    # The three renders are independent pdflatex/pdftocairo subprocess chains, so run them
+    # concurrently; each gets its own build subdirectory so .aux/.log/.pdf files don't collide.
+    renders = [
+        (arch_tikz, arch_png, "arch"),
+        (sm_pics[0], sm_init_png, "sm_init"),
+        (sm_pics[1], sm_resp_png, "sm_resp"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(renders)) as pool:
+        jobs = []
+        for tikz_body, out_png, sub in renders:
+            (build_dir / sub).mkdir(exist_ok=True)
+            jobs.append(
+                pool.submit(
+                    _render_tikz_to_png,
+                    tikz_body=tikz_body,
+                    out_png=out_png,
+                    build_dir=build_dir / sub,
+                    document_preamble=preamble,
+                )
+            )
+        for job in jobs:
+            job.result()
 
     # Create pandoc-friendly tex.
     pre_tex = _preprocess_tex_for_pandoc(
@@ -484,7 +622,7 @@ def main() -> int:
     backups = project_dir / ".build" / "docx_backups"
     backups.mkdir(parents=True, exist_ok=True)
     if out_docx.exists():
-        shutil.copy2(out_docx, backups / f"{out_docx.stem}.pre_paperpal{out_docx.suffix}")
+        _backup_if_changed(out_docx, backups / f"{out_docx.stem}.pre_paperpal{out_docx.suffix}")
     shutil.copy2(tmp_docx, out_docx)
 
     print(f"Wrote: {out_docx}")
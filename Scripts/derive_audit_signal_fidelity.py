@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import csv
+import os
 from pathlib import Path
 
 ARTIFACTS = Path("Artifacts")
@@ -13,57 +14,88 @@ FAULT_CLASSES = {
 
 
 def latest_csv(prefix: str) -> Path:
-    files = sorted(ARTIFACTS.glob(f"{prefix}_*.csv"))
-    if not files:
+    # Names carry the run date, so the lexicographically largest match is the latest run;
+    # one scandir pass finds it without building and sorting the full list.
+    head = prefix + "_"
+    latest = None
+    try:
+        with os.scandir(ARTIFACTS) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(head) and name.endswith(".csv") and (latest is None or name > latest):
+                    latest = name
+    except FileNotFoundError:
+        pass
+    if latest is None:
         raise SystemExit(f"No {prefix}_*.csv found in Artifacts/")
-    return files[-1]
+    return ARTIFACTS / latest
+
+
+def _header_index(reader):
+    header = next(reader, None) or []
+    return {name: i for i, name in enumerate(header)}
 
 
 def load_fault_rows(path: Path):
+    # (policy, scenario) -> (n_runs, E_handshakeFailed, E_cryptoDowngrade)
     rows = {}
     with path.open() as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        idx = _header_index(reader)
+        # Optional columns fall back to the same defaults as before: policy "default", counters 0.
+        policy_i = idx.get("policy")
+        scenario_i = idx["scenario"]
+        runs_i = idx["n_runs"]
+        failed_i = idx.get("E_handshakeFailed")
+        downgrade_i = idx.get("E_cryptoDowngrade")
         for row in reader:
-            policy = row.get("policy", "default")
-            scenario = row["scenario"]
-            rows[(policy, scenario)] = {
-                "n_runs": int(row["n_runs"]),
-                "E_handshakeFailed": int(row.get("E_handshakeFailed", 0)),
-                "E_cryptoDowngrade": int(row.get("E_cryptoDowngrade", 0)),
-            }
+            if not row:
+                continue
+            policy = row[policy_i] if policy_i is not None else "default"
+            rows[(policy, row[scenario_i])] = (
+                int(row[runs_i]),
+                int(row[failed_i]) if failed_i is not None else 0,
+                int(row[downgrade_i]) if downgrade_i is not None else 0,
+            )
     return rows
 
 
 def load_policy_rows(path: Path):
+    # policy -> (iterations, fallback_events)
     rows = {}
     with path.open() as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        idx = _header_index(reader)
+        policy_i = idx["policy"]
+        iterations_i = idx["iterations"]
+        fallback_i = idx.get("fallback_events")
         for row in reader:
-            policy = row["policy"]
-            rows[policy] = {
-                "iterations": int(row["iterations"]),
-                "fallback_events": int(row.get("fallback_events", 0)),
-            }
+            if not row:
+                continue
+            rows[row[policy_i]] = (
+                int(row[iterations_i]),
+                int(row[fallback_i]) if fallback_i is not None else 0,
+            )
     return rows
 
 
-def summarize_class(rows, policies, scenarios, expect_failed, expect_fallback):
+def summarize_class(rows, scenarios, expect_failed, expect_fallback):
+    # rows: one policy's scenario -> (n_runs, E_handshakeFailed, E_cryptoDowngrade)
     total_runs = 0
     tp_runs = 0
     fp_runs = 0
-    for policy in policies:
-        for name in scenarios:
-            key = (policy, name)
-            if key not in rows:
-                continue
-            r = rows[key]
-            total_runs += r["n_runs"]
-            failed_ok = (r["E_handshakeFailed"] == r["n_runs"]) if expect_failed else (r["E_handshakeFailed"] == 0)
-            fallback_ok = (r["E_cryptoDowngrade"] == 0) if expect_fallback == 0 else (r["E_cryptoDowngrade"] > 0)
-            if failed_ok and fallback_ok:
-                tp_runs += r["n_runs"]
-            else:
-                fp_runs += r["n_runs"]
+    for name in scenarios:
+        r = rows.get(name)
+        if r is None:
+            continue
+        n_runs, failed, downgrade = r
+        total_runs += n_runs
+        failed_ok = (failed == n_runs) if expect_failed else (failed == 0)
+        fallback_ok = (downgrade == 0) if expect_fallback == 0 else (downgrade > 0)
+        if failed_ok and fallback_ok:
+            tp_runs += n_runs
+        else:
+            fp_runs += n_runs
     tp_rate = (tp_runs / total_runs) if total_runs else 0.0
     fp_rate = (fp_runs / total_runs) if total_runs else 0.0
     return total_runs, tp_rate, fp_rate
@@ -80,11 +112,15 @@ def main():
 
     results = []
 
-    policies = sorted({policy for (policy, _) in fault_rows.keys()})
-    for policy in policies:
+    # Index once by policy so each summary only probes that policy's few scenarios.
+    by_policy = {}
+    for (policy, scenario), r in fault_rows.items():
+        by_policy.setdefault(policy, {})[scenario] = r
+
+    for policy in sorted(by_policy):
+        scenario_rows = by_policy[policy]
         total, tp, fp = summarize_class(
-            fault_rows,
-            [policy],
+            scenario_rows,
             FAULT_CLASSES["drop_timeout"],
             expect_failed=True,
             expect_fallback=0
@@ -98,8 +134,7 @@ def main():
         })
 
         total, tp, fp = summarize_class(
-            fault_rows,
-            [policy],
+            scenario_rows,
             FAULT_CLASSES["corrupt_wrong_sig"],
             expect_failed=True,
             expect_fallback=0
@@ -113,8 +148,7 @@ def main():
         })
 
         total, tp, fp = summarize_class(
-            fault_rows,
-            [policy],
+            scenario_rows,
             FAULT_CLASSES["benign_ordering"],
             expect_failed=False,
             expect_fallback=0
@@ -131,12 +165,13 @@ def main():
         row = policy_rows.get(policy)
         if not row:
             continue
+        iterations, fallback_events = row
         expect_fallback = 1 if policy == "default" else 0
-        tp_rate = 1.0 if ((row["fallback_events"] > 0) == (expect_fallback == 1)) else 0.0
+        tp_rate = 1.0 if ((fallback_events > 0) == (expect_fallback == 1)) else 0.0
         results.append({
             "scenario_class": f"pqc_unavailable_{policy}",
             "expected_signal": "cryptoDowngrade=1" if expect_fallback == 1 else "cryptoDowngrade=0",
-            "total_runs": row["iterations"],
+            "total_runs": iterations,
             "tp_rate": f"{tp_rate:.2f}",
             "fp_rate": f"{0.0:.2f}",
         })
@@ -4,16 +4,28 @@ Generate IEEE-quality PDF figures for SkyBridge Compass paper.
 All figures are vector format with consistent styling.
 """
 
+import os
+from pathlib import Path
+
+# Must precede the matplotlib import: keep its font cache in a persistent, writable
+# per-checkout directory (gitignored). When the default config dir is unwritable (CI,
+# sandboxes) matplotlib otherwise rebuilds the font list in every run and every worker.
+os.environ.setdefault("MPLCONFIGDIR", str(Path(__file__).resolve().parent / ".mpl_cache"))
+
 import matplotlib
 # Force a headless backend so this script runs reliably in CI/sandboxed environments.
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
+import argparse
 import csv
+import hashlib
 import math
-import os
-from pathlib import Path
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 
 # IEEE-style configuration
 # CRITICAL: pdf.fonttype=42 and ps.fonttype=42 force TrueType embedding
@@ -29,8 +41,6 @@ plt.rcParams.update({
     'legend.fontsize': 7,
     'figure.dpi': 300,
     'savefig.dpi': 300,
-    'savefig.bbox': 'tight',
-    'savefig.pad_inches': 0.02,
     'axes.linewidth': 0.5,
     'grid.linewidth': 0.3,
     'lines.linewidth': 1.0,
@@ -57,11 +67,22 @@ COLORS = {
 ROOT_DIR = Path(__file__).resolve().parents[1]
 ARTIFACTS_DIR = ROOT_DIR / "Artifacts"
 OUTPUT_DIR = str(ROOT_DIR / "figures")
+# Opt-in (SKYBRIDGE_FIGCACHE=1) on-disk cache of parsed artifact CSVs.
+FIGCACHE_DIR = Path.home() / ".cache" / "skybridge"
+# Incremental builds: which input files each figure was last rendered from.
+STAMP_DIR = ROOT_DIR / ".build" / "figures"
+SCRIPT_PATH = Path(__file__).resolve()
+MAKE_TABLES_PATH = SCRIPT_PATH.with_name("make_tables.py")
+
+# Set by --force / --no-preview; pool workers get them through the executor initializer.
+_FORCE_REBUILD = False
+_WRITE_PREVIEW = True
 
 def _requested_artifact_date() -> str | None:
     v = os.environ.get("ARTIFACT_DATE") or os.environ.get("SKYBRIDGE_ARTIFACT_DATE")
     return v if v else None
 
+@lru_cache(maxsize=None)
 def _latest_artifact_csv(prefix: str) -> Path:
     candidates = list(ARTIFACTS_DIR.glob(f"{prefix}_*.csv"))
     if not candidates:
@@ -81,22 +102,122 @@ def _artifact_csv(prefix: str) -> Path:
         return p
     return _latest_artifact_csv(prefix)
 
-def _read_csv_dicts(path: Path) -> list[dict[str, str]]:
-    with path.open(newline="") as f:
-        return list(csv.DictReader(f))
+def _figcache_enabled() -> bool:
+    return os.environ.get("SKYBRIDGE_FIGCACHE") == "1"
 
-def _pick_last_row(rows: list[dict[str, str]], predicate) -> dict[str, str]:
+def _parse_csv_dicts(path: Path) -> tuple[dict[str, str], ...]:
+    with path.open(newline="") as f:
+        return tuple(csv.DictReader(f))
+
+@lru_cache(maxsize=None)
+def _read_csv_dicts(path: Path) -> tuple[dict[str, str], ...]:
+    # Cached per process (several figures read the same artifact); rows are shared, don't mutate.
+    if not _figcache_enabled():
+        return _parse_csv_dicts(path)
+
+    # Keyed on (path, mtime, size) so an edited or regenerated artifact is parsed afresh.
+    st = path.stat()
+    key = hashlib.sha256(f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8")).hexdigest()
+    cache_path = FIGCACHE_DIR / f"{key}.pkl"
+    try:
+        with cache_path.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Best-effort cache: a truncated or foreign pickle is dropped and the CSV re-parsed.
+        cache_path.unlink(missing_ok=True)
+
+    rows = _parse_csv_dicts(path)
+    FIGCACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Workers may race on the same key; write privately, then rename into place.
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return rows
+
+@lru_cache(maxsize=None)
+def _parse_hs(path_str: str) -> dict:
+    # Representative-batch selection, cached per process like the other artifact reads.
+    # make_tables stays a lazy import: it creates Docs/tables dirs on import, and only the
+    # latency figure needs it (a module-level import would run in every spawn worker).
+    from make_tables import parse_handshake_bench  # type: ignore
+    return parse_handshake_bench(Path(path_str))
+
+def _pick_last_row(rows: tuple[dict[str, str], ...], predicate) -> dict[str, str]:
     for row in reversed(rows):
         if predicate(row):
             return row
     raise KeyError("No matching row found")
 
-def _save_figure(basename: str) -> None:
+def _set_build_options(force: bool, preview: bool) -> None:
+    global _FORCE_REBUILD, _WRITE_PREVIEW
+    _FORCE_REBUILD = force
+    _WRITE_PREVIEW = preview
+
+def _input_stamp(inputs: list[Path]) -> str:
+    return "\n".join(str(p.resolve()) for p in inputs)
+
+def _needs_rebuild(basename: str, inputs: list[Path]) -> bool:
+    """
+    Make-style check: skip a figure whose PDF/PNG are newer than its input CSVs (and this
+    script) and were rendered from the same input files (ARTIFACT_DATE may select others).
+    """
+    if _FORCE_REBUILD:
+        return True
+    exts = ("pdf", "png") if _WRITE_PREVIEW else ("pdf",)
+    outputs = [Path(f"{OUTPUT_DIR}/{basename}.{ext}") for ext in exts]
+    try:
+        built = min(p.stat().st_mtime for p in outputs)
+        if (STAMP_DIR / f"{basename}.inputs").read_text(encoding="utf-8") != _input_stamp(inputs):
+            return True
+    except FileNotFoundError:
+        return True
+    if any(p.stat().st_mtime >= built for p in [SCRIPT_PATH, *inputs]):
+        return True
+    print(f"Up to date: {basename}.pdf")
+    return False
+
+def _save_figure(basename: str, inputs: list[Path], *, tight: bool = False) -> None:
+    # Figures rely on plt.tight_layout(); bbox_inches="tight" costs an extra draw per savefig,
+    # so only figures with artists outside the axes layout opt into it.
     pdf_path = f"{OUTPUT_DIR}/{basename}.pdf"
     png_path = f"{OUTPUT_DIR}/{basename}.png"
-    plt.savefig(pdf_path, format="pdf")
-    plt.savefig(png_path, format="png")
-    print(f"Generated: {basename}.pdf (+ preview PNG)")
+    bbox = {"bbox_inches": "tight", "pad_inches": 0.02} if tight else {}
+    plt.savefig(pdf_path, format="pdf", **bbox)
+    if _WRITE_PREVIEW:
+        plt.savefig(png_path, format="png", **bbox)
+    STAMP_DIR.mkdir(parents=True, exist_ok=True)
+    (STAMP_DIR / f"{basename}.inputs").write_text(_input_stamp(inputs), encoding="utf-8")
+    print(f"Generated: {basename}.pdf" + (" (+ preview PNG)" if _WRITE_PREVIEW else ""))
+
+_FIGURE = None
+SUBPLOT_PARAMS = ("left", "bottom", "right", "top", "wspace", "hspace")
+
+def _subplots(nrows: int = 1, ncols: int = 1, *, figsize: tuple[float, float]):
+    """
+    plt.subplots() stand-in that reuses one Figure (and its Agg canvas) per process.
+
+    Reuse is safe because the fig_* functions only draw on the Axes returned here and call
+    plt.tight_layout(); none of them changes rcParams or other figure-level properties. The
+    state they do leave behind is reset below: artists (clf), size, layout engine, and the
+    subplot params tight_layout() moved. Output is byte-identical to fresh figures.
+    """
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(figsize=figsize)
+    fig = _FIGURE
+    fig.clf()
+    fig.set_layout_engine(None)
+    fig.set_size_inches(figsize)
+    # Applied in one update: SubplotParams validates left < right / bottom < top per call.
+    defaults = {}
+    for name in SUBPLOT_PARAMS:
+        defaults[name] = plt.rcParams[f"figure.subplot.{name}"]
+    fig.subplotpars.update(**defaults)
+    plt.figure(fig.number)
+    return fig, fig.subplots(nrows, ncols)
 
 def _wilson_95_ci(k: int, n: int) -> tuple[float, float]:
     if n <= 0:
@@ -108,25 +229,44 @@ def _wilson_95_ci(k: int, n: int) -> tuple[float, float]:
     half = (z * math.sqrt((p * (1 - p) + (z * z) / (4 * n)) / n)) / denom
     return (max(0.0, center - half), min(1.0, center + half))
 
+def _wilson_95_ci_vec(k: np.ndarray, n: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Elementwise _wilson_95_ci over arrays; entries with n <= 0 give (0, 0)."""
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    valid = n > 0
+    n = np.where(valid, n, 1.0)
+    z = 1.96
+    p = k / n
+    denom = 1 + (z * z) / n
+    center = (p + (z * z) / (2 * n)) / denom
+    half = (z * np.sqrt((p * (1 - p) + (z * z) / (4 * n)) / n)) / denom
+    lo = np.where(valid, np.maximum(0.0, center - half), 0.0)
+    hi = np.where(valid, np.minimum(1.0, center + half), 0.0)
+    return lo, hi
+
 def fig_handshake_latency():
     """Figure: Handshake latency percentiles comparison."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.2))
+    csv_path = _artifact_csv("handshake_bench")
+    inputs = [csv_path, MAKE_TABLES_PATH]
+    if not _needs_rebuild("fig_handshake_latency", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.2))
 
     configs = [
         "Classic\n(X25519+Ed25519)",
         "liboqs PQC\n(ML-KEM+ML-DSA)",
         "CryptoKit PQC\n(ML-KEM+ML-DSA)",
     ]
-    csv_path = _artifact_csv("handshake_bench")
 
     # Keep Fig.8 aligned with Table 7 / Supplementary Table S1:
     # select a representative complete batch instead of "last row".
     try:
-        from make_tables import ORDERED_PERF_CONFIGS, parse_handshake_bench  # type: ignore
+        from make_tables import ORDERED_PERF_CONFIGS  # type: ignore
     except Exception as e:  # pragma: no cover
         raise RuntimeError("Failed to import Scripts/make_tables.py; cannot select representative batch") from e
 
-    batch = parse_handshake_bench(csv_path)
+    batch = _parse_hs(str(csv_path))
     required = set(ORDERED_PERF_CONFIGS)
     if not required.issubset(batch.keys()):
         missing = ", ".join(sorted(required - set(batch.keys())))
@@ -164,14 +304,17 @@ def fig_handshake_latency():
                            ha='center', va='bottom', fontsize=6)
 
     plt.tight_layout()
-    _save_figure("fig_handshake_latency")
-    plt.close()
+    _save_figure("fig_handshake_latency", inputs)
 
 def fig_policy_downgrade():
     """Figure: Policy guard strictPQC vs default."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 1.8))
-
     csv_path = _artifact_csv("policy_downgrade")
+    inputs = [csv_path]
+    if not _needs_rebuild("fig_policy_downgrade", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 1.8))
+
     rows = _read_csv_dicts(csv_path)
 
     def policy_row(name: str) -> dict[str, str]:
@@ -193,11 +336,12 @@ def fig_policy_downgrade():
     fallback_events = [p["fallback"] * 1000 / max(p["iterations"], 1) for p in per_policy]
     classic_attempts = [p["classic"] * 1000 / max(p["iterations"], 1) for p in per_policy]
 
-    fallback_err = []
-    for p in per_policy:
-        lo, hi = _wilson_95_ci(p["fallback"], p["iterations"])
-        v = p["fallback"] / max(p["iterations"], 1) * 1000
-        fallback_err.append((v - lo * 1000, hi * 1000 - v))
+    fallback = np.array([p["fallback"] for p in per_policy])
+    iterations = np.array([p["iterations"] for p in per_policy])
+    lo, hi = _wilson_95_ci_vec(fallback, iterations)
+    v = fallback / np.maximum(iterations, 1) * 1000
+    # yerr rows: (below, above) per bar.
+    fallback_err = np.stack([v - lo * 1000, hi * 1000 - v])
 
     x = np.arange(len(policies))
     width = 0.35
@@ -207,7 +351,7 @@ def fig_policy_downgrade():
         fallback_events,
         width,
         label='Fallback Events',
-        yerr=np.array(fallback_err).T,
+        yerr=fallback_err,
         capsize=2,
                    color=COLORS['gray1'], edgecolor='black', linewidth=0.5)
     bars2 = ax.bar(x + width/2, classic_attempts, width, label='Classic Attempts',
@@ -236,12 +380,15 @@ def fig_policy_downgrade():
                        ha='center', va='bottom', fontsize=7)
 
     plt.tight_layout()
-    _save_figure("fig_policy_downgrade")
-    plt.close()
+    _save_figure("fig_policy_downgrade", inputs)
 
 def fig_downgrade_matrix():
     """Figure: Downgrade decision matrix."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.0))
+    inputs = []
+    if not _needs_rebuild("fig_downgrade_matrix", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.0))
 
     errors = ['pqcProvider\nUnavailable', 'suiteNegotiation\nFailed', 'timeout', 'signature\nVerifyFailed', 'identity\nMismatch']
     policies = ['default', 'strictPQC']
@@ -270,20 +417,28 @@ def fig_downgrade_matrix():
     ax.set_ylabel('Policy')
 
     plt.tight_layout()
-    _save_figure("fig_downgrade_matrix")
-    plt.close()
+    _save_figure("fig_downgrade_matrix", inputs)
 
 def fig_failure_histogram():
     """Figure: Failure-mode histogram of security events."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.0))
-
     fi_path = _artifact_csv("fault_injection")
+    policy_path = _artifact_csv("policy_downgrade")
+    inputs = [fi_path, policy_path]
+    if not _needs_rebuild("fig_failure_histogram", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.0))
+
     fi_rows = _read_csv_dicts(fi_path)
+    # Index once (last row per key wins, like _pick_last_row) instead of rescanning per scenario.
+    fi_index = {(r.get("policy"), r.get("scenario")): r for r in fi_rows}
 
     def fi_row(policy: str, scenario: str) -> dict[str, str]:
-        return _pick_last_row(fi_rows, lambda r: r.get("policy") == policy and r.get("scenario") == scenario)
+        row = fi_index.get((policy, scenario))
+        if row is None:
+            raise KeyError("No matching row found")
+        return row
 
-    policy_path = _artifact_csv("policy_downgrade")
     policy_rows = _read_csv_dicts(policy_path)
     default_policy = _pick_last_row(policy_rows, lambda r: r.get("policy") == "default")
     downgrade_count = int(default_policy["fallback_events"])
@@ -298,16 +453,13 @@ def fig_failure_histogram():
         ('PQC\nUnavailable', None),
     ]
 
-    failed_events = []
-    downgrade_events = []
-    for _, key in scenarios:
-        if key is None:
-            failed_events.append(0)
-            downgrade_events.append(downgrade_count)
-            continue
-        row = fi_row("default", key)
-        failed_events.append(int(row.get("E_handshakeFailed", 0)))
-        downgrade_events.append(int(row.get("E_cryptoDowngrade", 0)))
+    rows_by_scenario = [None if key is None else fi_row("default", key) for _, key in scenarios]
+    counts = np.array([
+        (0, downgrade_count) if row is None
+        else (int(row.get("E_handshakeFailed", 0)), int(row.get("E_cryptoDowngrade", 0)))
+        for row in rows_by_scenario
+    ], dtype=int)
+    failed_events, downgrade_events = counts[:, 0], counts[:, 1]
 
     x = np.arange(len(scenarios))
     width = 0.35
@@ -327,15 +479,18 @@ def fig_failure_histogram():
     ax.spines['right'].set_visible(False)
 
     plt.tight_layout()
-    _save_figure("fig_failure_histogram")
-    plt.close()
+    _save_figure("fig_failure_histogram", inputs)
 
 def fig_message_size_breakdown():
     """Figure: Handshake message size breakdown (payload-only bytes)."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.2))
+    csv_path = _artifact_csv("message_sizes")
+    inputs = [csv_path]
+    if not _needs_rebuild("fig_message_size_breakdown", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.2))
 
     messages = ["MessageA\nClassic", "MessageB\nClassic", "MessageA\nPQC", "MessageB\nPQC"]
-    csv_path = _artifact_csv("message_sizes")
     rows = _read_csv_dicts(csv_path)
     by_message = {r["message"]: r for r in rows if r.get("message")}
 
@@ -377,12 +532,15 @@ def fig_message_size_breakdown():
                    textcoords="offset points", ha='center', va='bottom', fontsize=6)
 
     plt.tight_layout()
-    _save_figure("fig_message_size_breakdown")
-    plt.close()
+    _save_figure("fig_message_size_breakdown", inputs)
 
 def fig_event_traces():
     """Figure: Audit-signal event trace (timeout case)."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 1.6))
+    inputs = []
+    if not _needs_rebuild("fig_event_traces", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 1.6))
 
     # Timeline representation
     events = [
@@ -406,12 +564,15 @@ def fig_event_traces():
     ax.axis('off')
 
     plt.tight_layout()
-    _save_figure("fig_event_traces")
-    plt.close()
+    _save_figure("fig_event_traces", inputs)
 
 def fig_handshake_sequence():
     """Figure: Handshake sequence diagram with transcript coverage."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 3.0))
+    inputs = []
+    if not _needs_rebuild("fig_handshake_sequence", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 3.0))
 
     # Lifelines
     ax.plot([0.2, 0.2], [0.1, 0.95], 'k-', linewidth=1)
@@ -445,17 +606,20 @@ def fig_handshake_sequence():
     ax.axis('off')
 
     plt.tight_layout()
-    _save_figure("fig_handshake_sequence")
-    plt.close()
+    _save_figure("fig_handshake_sequence", inputs)
 
 def fig_traffic_padding_overhead():
     """
     Figure: SBP2 traffic padding overhead for representative workloads.
     Data: Artifacts/traffic_padding_<date>.csv
     """
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.4))
-
     csv_path = _artifact_csv("traffic_padding")
+    inputs = [csv_path]
+    if not _needs_rebuild("fig_traffic_padding_overhead", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.4))
+
     rows = _read_csv_dicts(csv_path)
 
     # Labels to show (aligned with Supplementary Table S7)
@@ -476,24 +640,13 @@ def fig_traffic_padding_overhead():
     ]
 
     by_label = {r.get("label"): r for r in rows if r.get("label")}
+    present = [(key, short) for key, short in wanted if by_label.get(key)]
 
-    labels: list[str] = []
-    overhead_pct: list[float] = []
-    groups: list[str] = []  # HS / CP / DP
-    for key, short in wanted:
-        r = by_label.get(key)
-        if not r:
-            continue
-        ratio = float(r.get("overhead_ratio", "0") or 0.0)
-        pct = (ratio - 1.0) * 100.0 if ratio > 0 else 0.0
-        labels.append(short)
-        overhead_pct.append(pct)
-        if key.startswith("HS/"):
-            groups.append("HS")
-        elif key.startswith("CP/"):
-            groups.append("CP")
-        else:
-            groups.append("DP")
+    labels = [short for _, short in present]
+    # HS / CP / DP
+    groups = ["HS" if key.startswith("HS/") else "CP" if key.startswith("CP/") else "DP" for key, _ in present]
+    ratios = np.array([float(by_label[key].get("overhead_ratio", "0") or 0.0) for key, _ in present], dtype=float)
+    overhead_pct = np.where(ratios > 0, (ratios - 1.0) * 100.0, 0.0)
 
     y = np.arange(len(labels))
     # Grayscale-friendly styling: HS dark, CP mid, DP light + outline
@@ -527,14 +680,18 @@ def fig_traffic_padding_overhead():
     ax.legend(handles=legend, loc="upper right", framealpha=0.9)
 
     plt.tight_layout()
-    _save_figure("fig_traffic_padding_overhead")
-    plt.close()
+    # Value labels past the longest bar extend beyond the axes; keep them in the crop.
+    _save_figure("fig_traffic_padding_overhead", inputs, tight=True)
 
 def fig_traffic_padding_sensitivity():
     """Figure: SBP2 bucket-cap sensitivity (overhead vs cap)."""
-    fig, ax = plt.subplots(figsize=(COL_WIDTH, 2.0))
-
     csv_path = _artifact_csv("traffic_padding_sensitivity")
+    inputs = [csv_path]
+    if not _needs_rebuild("fig_traffic_padding_sensitivity", inputs):
+        return
+
+    fig, ax = _subplots(figsize=(COL_WIDTH, 2.0))
+
     rows = _read_csv_dicts(csv_path)
 
     # Convert and index
@@ -584,14 +741,17 @@ def fig_traffic_padding_sensitivity():
     ax.legend(loc="upper left", bbox_to_anchor=(0.0, 0.93), framealpha=0.9, fontsize=6)
 
     plt.tight_layout()
-    _save_figure("fig_traffic_padding_sensitivity")
-    plt.close()
+    _save_figure("fig_traffic_padding_sensitivity", inputs)
 
 def fig_system_impact_amortization():
     """Figure: System-level impact and amortization (p95)."""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(COL_WIDTH, 3.2))
-
     csv_path = _artifact_csv("system_impact")
+    inputs = [csv_path]
+    if not _needs_rebuild("fig_system_impact_amortization", inputs):
+        return
+
+    fig, (ax1, ax2) = _subplots(2, 1, figsize=(COL_WIDTH, 3.2))
+
     rows = _read_csv_dicts(csv_path)
 
     suites = [
@@ -673,26 +833,65 @@ def fig_system_impact_amortization():
     ax2.legend(loc="upper left", framealpha=0.9, fontsize=6)
 
     plt.tight_layout()
-    _save_figure("fig_system_impact_amortization")
-    plt.close()
+    _save_figure("fig_system_impact_amortization", inputs)
+
+FIGURES = [
+    fig_handshake_latency,
+    fig_policy_downgrade,
+    fig_downgrade_matrix,
+    fig_failure_histogram,
+    fig_message_size_breakdown,
+    fig_event_traces,
+    fig_handshake_sequence,
+    fig_system_impact_amortization,
+    fig_traffic_padding_overhead,
+    fig_traffic_padding_sensitivity,
+]
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate IEEE-quality figures for the paper.")
+    parser.add_argument(
+        "--singlecore",
+        action="store_true",
+        help="Render figures one after another in this process (easier to debug).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every figure even if its outputs are newer than its inputs.",
+    )
+    parser.add_argument(
+        "--no-preview",
+        dest="preview",
+        action="store_false",
+        help="Write only the PDFs (skip the PNG previews, which pandoc/DOCX builds use).",
+    )
+    args = parser.parse_args()
+
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print("Generating IEEE-quality PDF figures...")
     print(f"Output directory: {OUTPUT_DIR}")
     print()
 
-    fig_handshake_latency()
-    fig_policy_downgrade()
-    fig_downgrade_matrix()
-    fig_failure_histogram()
-    fig_message_size_breakdown()
-    fig_event_traces()
-    fig_handshake_sequence()
-    fig_system_impact_amortization()
-    fig_traffic_padding_overhead()
-    fig_traffic_padding_sensitivity()
+    _set_build_options(args.force, args.preview)
+    if args.singlecore:
+        for fig in FIGURES:
+            fig()
+    else:
+        # Each figure is independent and savefig-bound; pyplot is not thread-safe, so render
+        # them in worker processes. "spawn" gives every worker a fresh pyplot state with the
+        # module-level rcParams applied on import.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(len(FIGURES), os.cpu_count() or 1),
+            mp_context=ctx,
+            initializer=_set_build_options,
+            initargs=(args.force, args.preview),
+        ) as pool:
+            futures = [pool.submit(fig) for fig in FIGURES]
+            for future in as_completed(futures):
+                future.result()
 
     print()
     print("All figures generated successfully!")